@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the HARMONIA-Fast compression kernel.
+
+Compiles the Numba kernel from harmonia_fast.py into the
+`_harmonia_fast_core` extension module, so processes that hash only a
+few messages skip the JIT warm-up. harmonia_fast.py picks the extension
+up automatically when it is importable; the extension needs NumPy (but
+not Numba) at runtime.
+
+Usage:
+    python3 aot_build.py
+"""
+
+from numba.pycc import CC
+
+import harmonia_fast
+
+if harmonia_fast.njit is None:
+    raise SystemExit("aot_build.py requires Numba")
+
+cc = CC('_harmonia_fast_core')
+cc.verbose = True
+
+
+@cc.export('compress_blocks', 'void(uint32[::1], uint32[::1])')
+def compress_blocks(words, state):
+    """Compress every 16-word block of `words` into the uint32[16] state."""
+    harmonia_fast._compress_blocks_nb(words, state)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -12,45 +12,69 @@ Tests:
     7. Bit Independence Criterion (BIC)
 """
 
+import contextlib
 import hashlib
-import random
+import io
 import math
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
 from harmonia import harmonia
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# Fixed seed so every run (and every hash function) sees the same random inputs
+RNG_SEED = 0xC0FFEE
+
+# Number of set bits for every byte value
+_POPCNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
 def sha256(data: bytes) -> bytes:
     """SHA-256 hash."""
     return hashlib.sha256(data).digest()
 
-def bytes_to_bits(data: bytes) -> list:
-    """Convert bytes to list of bits."""
-    bits = []
-    for byte in data:
-        for i in range(7, -1, -1):
-            bits.append((byte >> i) & 1)
-    return bits
-
 def hamming_distance(a: bytes, b: bytes) -> int:
     """Count differing bits between two byte sequences."""
-    return sum(bin(x ^ y).count('1') for x, y in zip(a, b))
+    n = min(len(a), len(b))
+    return (int.from_bytes(a[:n], 'big') ^ int.from_bytes(b[:n], 'big')).bit_count()
+
+def hamming_distance_batch(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Count differing bits between matching rows of two (N, 32) uint8 digest matrices."""
+    return _POPCNT8[A ^ B].sum(axis=1, dtype=np.int64)
+
+# Digest matrices shared between tests: (hash_func, samples, width) -> (N, 32)
+_hash_cache = {}
 
-def flip_bit(data: bytes, bit_pos: int) -> bytes:
-    """Flip a single bit in the data."""
-    data = bytearray(data)
-    byte_idx = bit_pos // 8
-    bit_idx = 7 - (bit_pos % 8)
-    data[byte_idx] ^= (1 << bit_idx)
-    return bytes(data)
+def hash_range(hash_func, samples: int, width: int = None) -> np.ndarray:
+    """
+    Hash the big-endian integers 0..samples-1 into an (N, 32) uint8 matrix.
+
+    With width=None each integer uses its minimal byte length (at least 1),
+    otherwise exactly `width` bytes. Results are cached per hash function.
+    """
+    key = (hash_func, samples, width)
+    if key not in _hash_cache:
+        H = np.empty((samples, 32), dtype=np.uint8)
+        for i in range(samples):
+            msg = i.to_bytes(width or (i.bit_length() + 7) // 8 or 1, 'big')
+            H[i] = np.frombuffer(hash_func(msg), dtype=np.uint8)
+        _hash_cache[key] = H
+    return _hash_cache[key]
+
+def flip_bit_into(scratch: bytearray, src: bytes, bit_pos: int) -> bytes:
+    """Copy src into a reusable scratch buffer and flip a single bit there."""
+    scratch[:] = src
+    scratch[bit_pos >> 3] ^= 1 << (7 - (bit_pos & 7))
+    return bytes(scratch)
 
 # ============================================================================
 # TEST 1: AVALANCHE EFFECT
 # ============================================================================
 
-def test_avalanche(hash_func, name, samples=1000):
+def test_avalanche(hash_func, name, samples=1000, seed=RNG_SEED):
     """
     Test the avalanche effect: changing 1 input bit should change ~50% of output bits.
     """
@@ -58,21 +82,30 @@ def test_avalanche(hash_func, name, samples=1000):
     print(f"TEST 1: AVALANCHE EFFECT - {name}")
     print(f"{'='*60}")
 
-    bit_changes = []
-
-    for _ in range(samples):
-        # Random message
-        msg = random.randbytes(random.randint(1, 100))
-        original_hash = hash_func(msg)
-
-        # Flip random bit
-        bit_pos = random.randint(0, len(msg) * 8 - 1)
-        modified_msg = flip_bit(msg, bit_pos)
-        modified_hash = hash_func(modified_msg)
-
-        # Count changed bits
-        changed = hamming_distance(original_hash, modified_hash)
-        bit_changes.append(changed)
+    # Draw all random messages and bit positions in bulk
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(1, 101, size=samples)
+    flat = rng.bytes(int(lengths.sum()))
+    bit_positions = rng.integers(0, lengths * 8).tolist()
+    offsets = np.concatenate(([0], np.cumsum(lengths))).tolist()
+
+    # Generate all messages up front, then hash into (N, 32) digest matrices
+    originals = []
+    modified = []
+    scratch = bytearray()
+    for s in range(samples):
+        msg = flat[offsets[s]:offsets[s + 1]]
+        originals.append(msg)
+        modified.append(flip_bit_into(scratch, msg, bit_positions[s]))
+
+    orig = np.empty((samples, 32), dtype=np.uint8)
+    mod = np.empty((samples, 32), dtype=np.uint8)
+    for s in range(samples):
+        orig[s] = np.frombuffer(hash_func(originals[s]), dtype=np.uint8)
+        mod[s] = np.frombuffer(hash_func(modified[s]), dtype=np.uint8)
+
+    # Count changed bits for every sample at once
+    bit_changes = hamming_distance_batch(orig, mod).tolist()
 
     avg_change = sum(bit_changes) / len(bit_changes)
     pct_change = avg_change / 256 * 100
@@ -104,31 +137,21 @@ def test_bit_distribution(hash_func, name, samples=10000):
     print(f"TEST 2: BIT DISTRIBUTION - {name}")
     print(f"{'='*60}")
 
-    total_ones = 0
-    total_bits = 0
+    H = hash_range(hash_func, samples)
 
-    # Also track per-position distribution
-    position_ones = [0] * 256
+    # Track per-position distribution
+    position_ones = np.unpackbits(H, axis=1).sum(axis=0, dtype=np.int64)
 
-    for i in range(samples):
-        msg = i.to_bytes((i.bit_length() + 7) // 8 or 1, 'big')
-        h = hash_func(msg)
-        bits = bytes_to_bits(h)
-
-        for pos, bit in enumerate(bits):
-            if bit:
-                total_ones += 1
-                position_ones[pos] += 1
-            total_bits += 1
+    total_ones = int(position_ones.sum())
+    total_bits = samples * 256
 
     pct_ones = total_ones / total_bits * 100
 
     # Check per-position uniformity
     expected_ones = samples / 2
-    position_deviations = [abs(ones - expected_ones) / expected_ones * 100
-                          for ones in position_ones]
-    max_deviation = max(position_deviations)
-    avg_deviation = sum(position_deviations) / len(position_deviations)
+    position_deviations = np.abs(position_ones - expected_ones) / expected_ones * 100
+    max_deviation = float(position_deviations.max())
+    avg_deviation = float(position_deviations.mean())
 
     print(f"  Samples:              {samples}")
     print(f"  Total bits:           {total_bits}")
@@ -148,7 +171,7 @@ def test_bit_distribution(hash_func, name, samples=10000):
 # TEST 3: BIT INDEPENDENCE (CORRELATION)
 # ============================================================================
 
-def test_bit_correlation(hash_func, name, samples=5000):
+def test_bit_correlation(hash_func, name, samples=5000, seed=RNG_SEED):
     """
     Test that output bits are independent of each other.
     """
@@ -156,17 +179,23 @@ def test_bit_correlation(hash_func, name, samples=5000):
     print(f"TEST 3: BIT INDEPENDENCE - {name}")
     print(f"{'='*60}")
 
-    # Check correlation between adjacent bit pairs
-    pair_counts = Counter()  # (bit_i, bit_i+1) -> count
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(1, 51, size=samples)
+    flat = rng.bytes(int(lengths.sum()))
+    offsets = np.concatenate(([0], np.cumsum(lengths))).tolist()
 
+    H = np.empty((samples, 32), dtype=np.uint8)
     for i in range(samples):
-        msg = random.randbytes(random.randint(1, 50))
-        h = hash_func(msg)
-        bits = bytes_to_bits(h)
+        msg = flat[offsets[i]:offsets[i + 1]]
+        H[i] = np.frombuffer(hash_func(msg), dtype=np.uint8)
 
-        for j in range(len(bits) - 1):
-            pair = (bits[j], bits[j+1])
-            pair_counts[pair] += 1
+    # Check correlation between adjacent bit pairs: encode (bit_j, bit_j+1)
+    # as 2*bit_j + bit_j+1 and count the four combinations
+    bits = np.unpackbits(H, axis=1)
+    idx = (bits[:, :-1] << 1) | bits[:, 1:]
+    counts = np.bincount(idx.ravel(), minlength=4).tolist()
+    pair_counts = {(0, 0): counts[0], (0, 1): counts[1],
+                   (1, 0): counts[2], (1, 1): counts[3]}
 
     total_pairs = sum(pair_counts.values())
     expected = total_pairs / 4  # Each of 4 combinations should be 25%
@@ -202,18 +231,13 @@ def test_chi_square(hash_func, name, samples=10000):
     print(f"TEST 4: CHI-SQUARE (BYTE DISTRIBUTION) - {name}")
     print(f"{'='*60}")
 
-    byte_counts = [0] * 256
-    total_bytes = 0
+    H = hash_range(hash_func, samples)
 
-    for i in range(samples):
-        msg = i.to_bytes((i.bit_length() + 7) // 8 or 1, 'big')
-        h = hash_func(msg)
-        for byte in h:
-            byte_counts[byte] += 1
-            total_bytes += 1
+    byte_counts = np.bincount(H.ravel(), minlength=256)
+    total_bytes = int(byte_counts.sum())
 
     expected = total_bytes / 256
-    chi_square = sum((count - expected)**2 / expected for count in byte_counts)
+    chi_square = float(((byte_counts - expected)**2 / expected).sum())
 
     # Degrees of freedom = 255
     # Critical value at p=0.05 for df=255 is ~293
@@ -245,6 +269,9 @@ def test_chi_square(hash_func, name, samples=10000):
 # TEST 5: NEAR-COLLISION RESISTANCE
 # ============================================================================
 
+NEAR_COLLISION_SLICES = 4   # 32-bit digest slices used as sort keys
+NEAR_COLLISION_WINDOW = 64  # neighbours compared in each sorted order
+
 def test_near_collision(hash_func, name, samples=50000):
     """
     Test for near-collisions (hashes that are very similar).
@@ -253,29 +280,34 @@ def test_near_collision(hash_func, name, samples=50000):
     print(f"TEST 5: NEAR-COLLISION RESISTANCE - {name}")
     print(f"{'='*60}")
 
-    hashes = []
+    # Hash all messages into an (N, 32) matrix
+    H = hash_range(hash_func, samples, width=8)
+
+    # Near-collisions agree on long runs of bits, so sort the digests on
+    # several 32-bit slices and only compare rows that land within a small
+    # window of each other in sorted order
     min_distance = 256
     min_pair = (None, None)
 
-    for i in range(samples):
-        msg = i.to_bytes(8, 'big')
-        h = hash_func(msg)
-
-        # Compare with recent hashes (sliding window)
-        for prev_h in hashes[-100:]:
-            dist = hamming_distance(h, prev_h)
-            if dist < min_distance:
-                min_distance = dist
-                min_pair = (i, hashes.index(prev_h) if prev_h in hashes else -1)
+    for start in range(0, NEAR_COLLISION_SLICES * 4, 4):
+        key = H[:, start:start + 4].copy().view('>u4').ravel()
+        order = np.argsort(key, kind='stable')
+        Hs = H[order]
 
-        hashes.append(h)
+        for offset in range(1, min(NEAR_COLLISION_WINDOW, samples - 1) + 1):
+            dist = hamming_distance_batch(Hs[:-offset], Hs[offset:])
+            k = int(dist.argmin())
+            if dist[k] < min_distance:
+                min_distance = int(dist[k])
+                min_pair = (int(order[k]), int(order[k + offset]))
 
     # Expected minimum distance for random 256-bit hashes
-    # With 50000 samples, minimum ~90-100 bits is typical
+    # With 50000 samples and prefix-sorted neighbours, minimum ~80-100 bits is typical
 
     print(f"  Samples:              {samples}")
     print(f"  Minimum distance:     {min_distance} bits")
-    print(f"  Expected (random):    ~90-110 bits")
+    print(f"  Closest pair:         messages {min_pair[0]} and {min_pair[1]}")
+    print(f"  Expected (random):    ~80-100 bits")
 
     if min_distance >= 80:
         result = "EXCELLENT"
@@ -299,7 +331,7 @@ def test_near_collision(hash_func, name, samples=50000):
 # TEST 6: STRICT AVALANCHE CRITERION (SAC)
 # ============================================================================
 
-def test_sac(hash_func, name, samples=500):
+def test_sac(hash_func, name, samples=500, seed=RNG_SEED):
     """
     Strict Avalanche Criterion: flipping each input bit should change
     each output bit with probability 0.5.
@@ -308,34 +340,32 @@ def test_sac(hash_func, name, samples=500):
     print(f"TEST 6: STRICT AVALANCHE CRITERION - {name}")
     print(f"{'='*60}")
 
-    # For each output bit position, count how often it flips
-    flip_counts = [[0] * 256 for _ in range(64)]  # 64 input bits -> 256 output bits
+    rng = np.random.default_rng(seed)
+    flat = rng.bytes(samples * 8)
+
+    # Hash every original message and each of its 64 single-bit variants
+    orig = np.empty((samples, 32), dtype=np.uint8)
+    mod = np.empty((samples, 64, 32), dtype=np.uint8)
+    scratch = bytearray(8)
 
-    for _ in range(samples):
-        msg = random.randbytes(8)  # 64 bits
-        original_hash = hash_func(msg)
-        original_bits = bytes_to_bits(original_hash)
+    for s in range(samples):
+        msg = flat[s * 8:(s + 1) * 8]  # 64 bits
+        orig[s] = np.frombuffer(hash_func(msg), dtype=np.uint8)
 
         for input_bit in range(64):
-            modified_msg = flip_bit(msg, input_bit)
-            modified_hash = hash_func(modified_msg)
-            modified_bits = bytes_to_bits(modified_hash)
+            modified_msg = flip_bit_into(scratch, msg, input_bit)
+            mod[s, input_bit] = np.frombuffer(hash_func(modified_msg), dtype=np.uint8)
 
-            for output_bit in range(256):
-                if original_bits[output_bit] != modified_bits[output_bit]:
-                    flip_counts[input_bit][output_bit] += 1
+    # flip_counts[input_bit][output_bit]: 64 input bits -> 256 output bits
+    diffs = np.unpackbits(orig[:, None, :] ^ mod, axis=2)
+    flip_counts = diffs.sum(axis=0, dtype=np.int64)
 
     # Calculate deviation from 0.5 probability
     expected = samples / 2
-    deviations = []
+    deviations = np.abs(flip_counts - expected) / expected
 
-    for i in range(64):
-        for j in range(256):
-            dev = abs(flip_counts[i][j] - expected) / expected
-            deviations.append(dev)
-
-    avg_deviation = sum(deviations) / len(deviations) * 100
-    max_deviation = max(deviations) * 100
+    avg_deviation = float(deviations.mean()) * 100
+    max_deviation = float(deviations.max()) * 100
 
     print(f"  Samples:              {samples}")
     print(f"  Input bits tested:    64")
@@ -390,8 +420,27 @@ def test_length_sensitivity(hash_func, name):
 # MAIN
 # ============================================================================
 
-def run_all_tests():
-    """Run all cryptographic tests and compare results."""
+def _run_captured(test_funcs, hash_func, name):
+    """Run a group of tests in a worker, returning a (printed report, result dict) per test."""
+    out = []
+    for test_func in test_funcs:
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            result = test_func(hash_func, name)
+        out.append((buf.getvalue(), result))
+    return out
+
+def run_all_tests(workers=None):
+    """
+    Run all cryptographic tests and compare results.
+
+    Every (test, hash function) pair is independent and seeded, so they are
+    spread over a process pool of `workers` processes (default: CPU count).
+    Tests that hash the same inputs are grouped into one job so they share
+    the digest cache of hash_range. Reports are printed in the usual order
+    once every job has finished.
+    Pass workers=1 to run everything sequentially in this process.
+    """
 
     print("\n" + "="*60)
     print("  HARMONIA vs SHA-256 - CRYPTOGRAPHIC QUALITY COMPARISON")
@@ -409,9 +458,32 @@ def run_all_tests():
         ('length', test_length_sensitivity),
     ]
 
-    for test_name, test_func in tests:
-        results['harmonia'][test_name] = test_func(harmonia, "HARMONIA")
-        results['sha256'][test_name] = test_func(sha256, "SHA-256")
+    # bit_dist and chi_square both hash 0..9999; in one job the second
+    # reuses the first's digests instead of hashing them again
+    groups = [['avalanche'], ['bit_dist', 'chi_square'], ['bit_corr'],
+              ['near_coll'], ['sac'], ['length']]
+
+    hashes = [('harmonia', harmonia, "HARMONIA"), ('sha256', sha256, "SHA-256")]
+
+    if workers == 1:
+        for test_name, test_func in tests:
+            for key, hash_func, label in hashes:
+                results[key][test_name] = test_func(hash_func, label)
+    else:
+        test_funcs = dict(tests)
+        reports = {}
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            jobs = [(group, key, ex.submit(_run_captured, [test_funcs[t] for t in group],
+                                          hash_func, label))
+                    for group in groups
+                    for key, hash_func, label in hashes]
+            for group, key, future in jobs:
+                for test_name, (report, result) in zip(group, future.result()):
+                    reports[test_name, key] = report
+                    results[key][test_name] = result
+        for test_name, _ in tests:
+            for key, _, _ in hashes:
+                print(reports[test_name, key], end='')
 
     # Summary
     print("\n" + "="*60)
@@ -17,10 +17,32 @@ Usage:
 
     digest = harmonia_fast(b"message")
     hex_digest = harmonia_fast_hex(b"message")
+
+If Numba is installed, block compression runs in a JIT-compiled kernel;
+otherwise the pure-Python reference rounds are used. Running
+`python3 aot_build.py` once ahead-of-time compiles the same kernel into
+the `_harmonia_fast_core` extension, which is preferred when present and
+needs only NumPy at runtime (no JIT warm-up). All paths produce
+identical digests.
 """
 
 import struct
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the pure-Python rounds are always available
+    njit = None
+
+try:
+    import _harmonia_fast_core  # built by aot_build.py
+except ImportError:
+    _harmonia_fast_core = None
 
 VERSION = "1.0"
 BLOCK_SIZE = 64   # 512 bits
@@ -117,15 +139,38 @@ def _penrose_index(n: int) -> int:
     y = int(n * PHI * PHI) % 256
     return (x ^ y) % 32
 
+# ============================================================================
+# PRECOMPUTED ROUND SCHEDULE
+# ============================================================================
+
+# Round type per round (True = golden 'A', False = complementary 'B')
+ROUND_TYPE = tuple(FIBONACCI_WORD[r % len(FIBONACCI_WORD)] == 'A'
+                   for r in range(NUM_ROUNDS))
+
+# Round constants indexed directly by round number
+K_SCHEDULE_PHI = tuple(PHI_CONSTANTS[r % 16] for r in range(NUM_ROUNDS))
+K_SCHEDULE_REC = tuple(RECIPROCAL_CONSTANTS[r % 16] for r in range(NUM_ROUNDS))
+
+# MIX_ROTATIONS[r][i] = (rot1, rot2) used when mixing state word i in round r
+MIX_ROTATIONS = tuple(
+    tuple((_quasicrystal_rotation(r, i), _quasicrystal_rotation(r + 1, i + 1))
+          for i in range(STATE_WORDS))
+    for r in range(NUM_ROUNDS)
+)
+
+# Cross-stream diffusion rotation per round
+CROSS_ROTATIONS = tuple(_quasicrystal_rotation(r, 4) for r in range(NUM_ROUNDS))
+
+# Penrose indices used by message expansion (by word index) and finalization
+_PENROSE_EXPAND = tuple(_penrose_index(i) for i in range(NUM_ROUNDS))
+_PENROSE_FIN = tuple(_penrose_index(i * 31 + 17) for i in range(STATE_WORDS))
+
 # ============================================================================
 # MIXING FUNCTIONS
 # ============================================================================
 
-def _mix_golden(a: int, b: int, k: int, r: int, i: int) -> Tuple[int, int]:
+def _mix_golden(a: int, b: int, k: int, rot1: int, rot2: int) -> Tuple[int, int]:
     """Golden mixing function (Type A)."""
-    rot1 = _quasicrystal_rotation(r, i)
-    rot2 = _quasicrystal_rotation(r + 1, i + 1)
-
     a = _rotr(a, rot1)
     a = (a + b) & MASK32
     a = a ^ k
@@ -140,11 +185,8 @@ def _mix_golden(a: int, b: int, k: int, r: int, i: int) -> Tuple[int, int]:
 
     return a & MASK32, b & MASK32
 
-def _mix_complementary(a: int, b: int, k: int, r: int, i: int) -> Tuple[int, int]:
+def _mix_complementary(a: int, b: int, k: int, rot1: int, rot2: int) -> Tuple[int, int]:
     """Complementary mixing function (Type B)."""
-    rot1 = _quasicrystal_rotation(r, i)
-    rot2 = _quasicrystal_rotation(r + 1, i + 1)
-
     a = a ^ b
     a = _rotl(a, rot1)
     a = (a + (k >> 1)) & MASK32
@@ -181,27 +223,24 @@ def _edge_protection(state: List[int], r: int) -> List[int]:
 # CORE FUNCTIONS
 # ============================================================================
 
-def _pad_message(message: bytes) -> bytes:
-    """Merkle-Damgård padding."""
+def _pad_message(message: bytes) -> bytearray:
+    """Merkle-Damgård padding into a single pre-sized buffer."""
     msg_len = len(message)
-    bit_len = msg_len * 8
-
-    padded = bytearray(message)
-    padded.append(0x80)
-
-    while (len(padded) + 8) % BLOCK_SIZE != 0:
-        padded.append(0x00)
+    pad_len = -(msg_len + 9) % BLOCK_SIZE
 
-    padded.extend(struct.pack('>Q', bit_len))
-    return bytes(padded)
+    padded = bytearray(msg_len + 1 + pad_len + 8)
+    padded[:msg_len] = message
+    padded[msg_len] = 0x80
+    struct.pack_into('>Q', padded, len(padded) - 8, msg_len * 8)
+    return padded
 
 def _init_state() -> Tuple[List[int], List[int]]:
     """Initialize dual state vectors."""
     return list(PHI_CONSTANTS[:STATE_WORDS]), list(RECIPROCAL_CONSTANTS[:STATE_WORDS])
 
-def _expand_message(block: bytes) -> List[int]:
-    """Expand 64-byte block to NUM_ROUNDS words."""
-    w = list(struct.unpack('>16I', block))
+def _expand_message(block: bytes, w: List[int]) -> List[int]:
+    """Expand 64-byte block to NUM_ROUNDS words into the scratch list w."""
+    w[:16] = struct.unpack_from('>16I', block)
 
     for i in range(16, NUM_ROUNDS):
         rot1 = _quasicrystal_rotation(i, 0)
@@ -210,55 +249,54 @@ def _expand_message(block: bytes) -> List[int]:
         s0 = _rotr(w[i-15], rot1) ^ _rotr(w[i-15], rot1 + 5) ^ (w[i-15] >> 3)
         s1 = _rotr(w[i-2], rot2) ^ _rotr(w[i-2], rot2 + 7) ^ (w[i-2] >> 10)
 
-        fib_idx = _penrose_index(i)
-        fib_factor = FIBONACCI[fib_idx % 12]
+        fib_factor = FIBONACCI[_PENROSE_EXPAND[i] % 12]
 
-        w.append((w[i-16] + s0 + w[i-7] + s1 + fib_factor) & MASK32)
+        w[i] = (w[i-16] + s0 + w[i-7] + s1 + fib_factor) & MASK32
 
     return w
 
-def _cross_stream_diffusion(g: List[int], c: List[int], r: int) -> Tuple[List[int], List[int]]:
-    """Cross-stream diffusion."""
-    rot = _quasicrystal_rotation(r, 4)
-
-    for i in range(8):
-        temp = (g[i] ^ c[(i + 3) % 8]) & MASK32
-        g[i] = (g[i] + _rotr(temp, rot)) & MASK32
-        c[i] = (c[i] ^ _rotl(temp, rot)) & MASK32
-
-    return g, c
-
-def _compress(block: bytes, state_g: List[int], state_c: List[int]) -> Tuple[List[int], List[int]]:
-    """Compress a 64-byte block (32 rounds)."""
-    w = _expand_message(block)
+def _compress(block: bytes, state_g: List[int], state_c: List[int],
+              w: Optional[List[int]] = None) -> Tuple[List[int], List[int]]:
+    """Compress a 64-byte block (32 rounds), reusing w as schedule scratch if given."""
+    if w is None:
+        w = [0] * NUM_ROUNDS
+    _expand_message(block, w)
 
     g = state_g[:]
     c = state_c[:]
 
     for r in range(NUM_ROUNDS):
-        round_type = FIBONACCI_WORD[r % len(FIBONACCI_WORD)]
-        k_phi = PHI_CONSTANTS[r % 16]
-        k_rec = RECIPROCAL_CONSTANTS[r % 16]
-
-        if round_type == 'A':
-            for idx in range(4):
-                i = idx
-                j = (idx + 4) % 8
-                g[i], g[j] = _mix_golden(g[i], g[j], k_phi ^ w[r], r, i)
-                c[i], c[j] = _mix_golden(c[i], c[j], k_rec ^ w[(r + 1) % NUM_ROUNDS], r, j)
-        else:
-            for idx in range(4):
-                i = idx
-                j = (idx + 4) % 8
-                g[i], g[j] = _mix_complementary(g[i], g[j], k_phi ^ w[r], r, i)
-                c[i], c[j] = _mix_complementary(c[i], c[j], k_rec ^ w[(r + 1) % NUM_ROUNDS], r, j)
+        k_g = K_SCHEDULE_PHI[r] ^ w[r]
+        k_c = K_SCHEDULE_REC[r] ^ w[(r + 1) % NUM_ROUNDS]
+        rots = MIX_ROTATIONS[r]
+        mix = _mix_golden if ROUND_TYPE[r] else _mix_complementary
 
-        if r > 0 and r % 8 == 0:
-            g = _edge_protection(g, r)
-            c = _edge_protection(c, r)
+        for i in range(4):
+            j = i + 4
+            g[i], g[j] = mix(g[i], g[j], k_g, *rots[i])
+            c[i], c[j] = mix(c[i], c[j], k_c, *rots[j])
 
+        # Edge protection every 8 rounds, in place on both streams
+        if r > 0 and r % 8 == 0:
+            rot_l = _quasicrystal_rotation(r, 0)
+            rot_r = _quasicrystal_rotation(r, 7)
+            left_const = (FIBONACCI[r % 12] * 0x9E3779B9) & MASK32
+            right_const = (~left_const) & MASK32
+
+            for s in (g, c):
+                s0 = _rotr(s[0], rot_l) ^ left_const
+                s7 = _rotl(s[7], rot_r) ^ right_const
+                interaction = (s0 ^ s7) >> 16
+                s[0] = (s0 + interaction) & MASK32
+                s[7] = (s7 + interaction) & MASK32
+
+        # Cross-stream diffusion every 4 rounds
         if r > 0 and r % 4 == 0:
-            g, c = _cross_stream_diffusion(g, c, r)
+            rot = CROSS_ROTATIONS[r]
+            for i in range(8):
+                temp = g[i] ^ c[(i + 3) % 8]
+                g[i] = (g[i] + _rotr(temp, rot)) & MASK32
+                c[i] ^= _rotl(temp, rot)
 
     new_g = [(state_g[i] + g[i]) & MASK32 for i in range(8)]
     new_c = [(state_c[i] + c[i]) & MASK32 for i in range(8)]
@@ -279,14 +317,167 @@ def _finalize(state_g: List[int], state_c: List[int]) -> bytes:
 
         combined = g_rot ^ c_rot
 
-        penrose = _penrose_index(i * 31 + 17)
-        perturbation = (PHI_CONSTANTS[i] >> penrose) & 0xFF
+        perturbation = (PHI_CONSTANTS[i] >> _PENROSE_FIN[i]) & 0xFF
         combined = (combined + perturbation) & MASK32
 
         digest_words.append(combined)
 
     return struct.pack('>8I', *digest_words)
 
+# ============================================================================
+# COMPILED BACKEND (optional, requires Numba)
+# ============================================================================
+#
+# Mirrors the pure-Python functions above on uint32 arrays so the whole
+# message is compressed in native code. Additions wrap modulo 2^32 without
+# masking; each result is narrowed back to uint32 with np.uint32().
+
+_HAVE_NUMBA = njit is not None
+
+if _HAVE_NUMBA:
+    _QC_TABLE = np.array(QUASICRYSTAL_ROTATIONS, dtype=np.uint32)
+    _ROUND_TYPE_NP = np.array(ROUND_TYPE, dtype=np.uint8)
+    _K_PHI_NP = np.array(K_SCHEDULE_PHI, dtype=np.uint32)
+    _K_REC_NP = np.array(K_SCHEDULE_REC, dtype=np.uint32)
+    _MIX_ROT_NP = np.array(MIX_ROTATIONS, dtype=np.uint32)
+    _CROSS_ROT_NP = np.array(CROSS_ROTATIONS, dtype=np.uint32)
+    _PENROSE_EXPAND_NP = np.array(_PENROSE_EXPAND, dtype=np.uint8)
+    _FIB_NP = np.array(FIBONACCI, dtype=np.uint32)
+
+    @njit(inline='always')
+    def _rotr_nb(value, amount):
+        return np.uint32((value >> amount) | (value << (32 - amount)))
+
+    @njit(inline='always')
+    def _rotl_nb(value, amount):
+        return np.uint32((value << amount) | (value >> (32 - amount)))
+
+    @njit(inline='always')
+    def _quasicrystal_rotation_nb(round_num, state_index):
+        return _QC_TABLE[round_num % 32, state_index % 10]
+
+    @njit(inline='always')
+    def _mix_golden_nb(a, b, k, rot1, rot2):
+        a = _rotr_nb(a, rot1)
+        a = np.uint32(np.uint32(a + b) ^ k)
+
+        b = _rotl_nb(b, rot2)
+        b = np.uint32((b ^ a) + k)
+
+        mix = np.uint32((a * np.uint32(3)) ^ (b * np.uint32(5)))
+        a = np.uint32(a ^ (mix >> 11))
+        b = np.uint32(b ^ (mix << 7))
+
+        return a, b
+
+    @njit(inline='always')
+    def _mix_complementary_nb(a, b, k, rot1, rot2):
+        a = _rotl_nb(np.uint32(a ^ b), rot1)
+        a = np.uint32(a + (k >> 1))
+
+        b = np.uint32(b + a)
+        b = np.uint32(_rotr_nb(b, rot2) ^ (k >> 1))
+
+        return a, b
+
+    @njit(inline='always')
+    def _edge_protection_nb(s, base, r):
+        """Edge protection on lanes base..base+7 of the working buffer, in place."""
+        rot_l = _quasicrystal_rotation_nb(r, 0)
+        rot_r = _quasicrystal_rotation_nb(r, 7)
+        left_const = np.uint32(_FIB_NP[r % 12] * np.uint32(0x9E3779B9))
+
+        s0 = np.uint32(_rotr_nb(s[base], rot_l) ^ left_const)
+        s7 = np.uint32(_rotl_nb(s[base + 7], rot_r) ^ ~left_const)
+
+        interaction = np.uint32((s0 ^ s7) >> 16)
+        s[base] = s0 + interaction
+        s[base + 7] = s7 + interaction
+
+    @njit(inline='always')
+    def _expand_message_nb(block_words, w):
+        """Expand one block into the uint32[NUM_ROUNDS] scratch buffer w."""
+        w[:16] = block_words
+
+        for i in range(16, NUM_ROUNDS):
+            rot1 = _quasicrystal_rotation_nb(i, 0)
+            rot2 = _quasicrystal_rotation_nb(i, 1)
+
+            s0 = np.uint32(_rotr_nb(w[i-15], rot1) ^ _rotr_nb(w[i-15], rot1 + 5) ^ (w[i-15] >> 3))
+            s1 = np.uint32(_rotr_nb(w[i-2], rot2) ^ _rotr_nb(w[i-2], rot2 + 7) ^ (w[i-2] >> 10))
+
+            fib_factor = _FIB_NP[_PENROSE_EXPAND_NP[i] % 12]
+
+            w[i] = w[i-16] + s0 + w[i-7] + s1 + fib_factor
+
+    @njit(inline='always')
+    def _cross_stream_diffusion_nb(s, r):
+        """Cross-stream diffusion between lanes 0..7 (g) and 8..15 (c), in place."""
+        rot = _CROSS_ROT_NP[r]
+
+        for i in range(8):
+            temp = np.uint32(s[i] ^ s[8 + (i + 3) % 8])
+            s[i] = s[i] + _rotr_nb(temp, rot)
+            s[8 + i] = s[8 + i] ^ _rotl_nb(temp, rot)
+
+    @njit(cache=True, boundscheck=False)
+    def _compress_nb(block_words, state, w):
+        """
+        Compress one block into state, a uint32[16] buffer holding g[0..7]
+        followed by c[0..7]. w is a uint32[NUM_ROUNDS] schedule scratch
+        shared across blocks.
+
+        The four (i, i + 4) pairs of a round are independent, so each stream
+        is mixed as a fixed 4-lane loop over the low and high halves.
+        """
+        _expand_message_nb(block_words, w)
+        s = state.copy()
+
+        for r in range(NUM_ROUNDS):
+            k_g = np.uint32(_K_PHI_NP[r] ^ w[r])
+            k_c = np.uint32(_K_REC_NP[r] ^ w[(r + 1) % NUM_ROUNDS])
+            rot = _MIX_ROT_NP[r]
+
+            if _ROUND_TYPE_NP[r]:
+                for lane in range(4):
+                    s[lane], s[lane + 4] = _mix_golden_nb(
+                        s[lane], s[lane + 4], k_g, rot[lane, 0], rot[lane, 1])
+                for lane in range(4):
+                    s[lane + 8], s[lane + 12] = _mix_golden_nb(
+                        s[lane + 8], s[lane + 12], k_c, rot[lane + 4, 0], rot[lane + 4, 1])
+            else:
+                for lane in range(4):
+                    s[lane], s[lane + 4] = _mix_complementary_nb(
+                        s[lane], s[lane + 4], k_g, rot[lane, 0], rot[lane, 1])
+                for lane in range(4):
+                    s[lane + 8], s[lane + 12] = _mix_complementary_nb(
+                        s[lane + 8], s[lane + 12], k_c, rot[lane + 4, 0], rot[lane + 4, 1])
+
+            if r > 0 and r % 8 == 0:
+                _edge_protection_nb(s, 0, r)
+                _edge_protection_nb(s, 8, r)
+
+            if r > 0 and r % 4 == 0:
+                _cross_stream_diffusion_nb(s, r)
+
+        for i in range(16):
+            state[i] += s[i]
+
+    @njit(cache=True)
+    def _compress_blocks_nb(words, state):
+        """Run `_compress_nb` over every 16-word block of the padded message."""
+        w = np.empty(NUM_ROUNDS, dtype=np.uint32)
+        for off in range(0, words.shape[0], 16):
+            _compress_nb(words[off:off + 16], state, w)
+
+# Native block compressor: the AOT-built extension if present, else the JIT kernel
+if _harmonia_fast_core is not None:
+    _compress_blocks_native = _harmonia_fast_core.compress_blocks
+elif _HAVE_NUMBA:
+    _compress_blocks_native = _compress_blocks_nb
+else:
+    _compress_blocks_native = None
+
 # ============================================================================
 # PUBLIC API
 # ============================================================================
@@ -307,9 +498,17 @@ def harmonia_fast(message: bytes) -> bytes:
     padded = _pad_message(message)
     state_g, state_c = _init_state()
 
+    if _compress_blocks_native is not None:
+        words = np.frombuffer(padded, dtype='>u4').astype(np.uint32)
+        state = np.array(state_g + state_c, dtype=np.uint32)
+        _compress_blocks_native(words, state)
+        state = state.tolist()
+        return _finalize(state[:STATE_WORDS], state[STATE_WORDS:])
+
+    view = memoryview(padded)
+    w = [0] * NUM_ROUNDS
     for i in range(0, len(padded), BLOCK_SIZE):
-        block = padded[i:i+BLOCK_SIZE]
-        state_g, state_c = _compress(block, state_g, state_c)
+        state_g, state_c = _compress(view[i:i+BLOCK_SIZE], state_g, state_c, w)
 
     return _finalize(state_g, state_c)
 
@@ -345,7 +544,7 @@ def self_test() -> bool:
     msg2 = b"tess"
     h1 = harmonia_fast(msg1)
     h2 = harmonia_fast(msg2)
-    diff_bits = sum(bin(a ^ b).count('1') for a, b in zip(h1, h2))
+    diff_bits = (int.from_bytes(h1, 'big') ^ int.from_bytes(h2, 'big')).bit_count()
     pct = diff_bits / 256 * 100
     print(f"  'test' vs 'tess': {diff_bits}/256 bits ({pct:.1f}%)")
     print(f"  Status: {'PASS' if 45 <= pct <= 55 else 'FAIL'}")
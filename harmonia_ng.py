@@ -12,13 +12,30 @@ Key differences from HARMONIA-64:
 - ChaCha-style quarter-round mixing (removed a*3 XOR b*5)
 - Simplified edge protection with fixed rotations
 
+If the C library built by `make python-ng-lib` is present, hashing is
+delegated to it through ctypes. Otherwise, if Numba is installed, block
+compression runs in a JIT-compiled uint32 kernel; failing both, the
+pure-Python reference rounds are used. All paths produce identical digests.
+
 Version: 1.0
 Author: Based on HARMONIA by Fausto Dasè
 """
 
+import ctypes
+import os
 import struct
 from typing import List, Tuple
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the pure-Python rounds are always available
+    njit = prange = None
+
 # ============================================================================
 # CONSTANTS
 # ============================================================================
@@ -98,6 +115,17 @@ EDGE_ROT_RIGHT = 13
 # Fixed rotation for cross-stream diffusion
 CROSS_STREAM_ROT = 11
 
+# Per-round and per-index lookups, so the hot paths index instead of
+# reducing modulo 16, 12 or STATE_WORDS. Finalization uses rounds 32 and 33.
+_PHI_BY_ROUND = tuple(PHI_CONSTANTS[r % 16] for r in range(NUM_ROUNDS))
+_REC_BY_ROUND = tuple(RECIPROCAL_CONSTANTS[r % 16] for r in range(NUM_ROUNDS))
+_FIB_BY_ROUND = tuple(FIBONACCI[r % 12] for r in range(NUM_ROUNDS + 2))
+_C_ROT_IDX = tuple((i + 3) % STATE_WORDS for i in range(STATE_WORDS))
+
+# Edge-protection constants fib * 0x9E3779B9 per round, and their complements
+_FIB_CONSTS = tuple((f * 0x9E3779B9) & MASK32 for f in _FIB_BY_ROUND)
+_FIB_CONSTS_INV = tuple(k ^ MASK32 for k in _FIB_CONSTS)
+
 
 # ============================================================================
 # PRIMITIVE OPERATIONS
@@ -127,25 +155,26 @@ def _quarter_round(state: List[int], a: int, b: int, c: int, d: int,
     All 4 rotations are fixed for this call, enabling SIMD vectorization.
     Operates in-place on the state array.
     """
+    # Rotations are written out inline (all amounts are in 1..31)
     # Step 1: a += b; d ^= a; d <<<= r1
     state[a] = (state[a] + state[b]) & MASK32
-    state[d] ^= state[a]
-    state[d] = _rotl(state[d], r1)
+    x = state[d] ^ state[a]
+    state[d] = ((x << r1) | (x >> (32 - r1))) & MASK32
 
     # Step 2: c += d; b ^= c; b <<<= r2
     state[c] = (state[c] + state[d]) & MASK32
-    state[b] ^= state[c]
-    state[b] = _rotl(state[b], r2)
+    x = state[b] ^ state[c]
+    state[b] = ((x << r2) | (x >> (32 - r2))) & MASK32
 
     # Step 3: a += b; d ^= a; d <<<= r3
     state[a] = (state[a] + state[b]) & MASK32
-    state[d] ^= state[a]
-    state[d] = _rotl(state[d], r3)
+    x = state[d] ^ state[a]
+    state[d] = ((x << r3) | (x >> (32 - r3))) & MASK32
 
     # Step 4: c += d; b ^= c; b <<<= r4
     state[c] = (state[c] + state[d]) & MASK32
-    state[b] ^= state[c]
-    state[b] = _rotl(state[b], r4)
+    x = state[b] ^ state[c]
+    state[b] = ((x << r4) | (x >> (32 - r4))) & MASK32
 
 
 # ============================================================================
@@ -160,7 +189,7 @@ def _edge_protection(state: List[int], round_num: int) -> None:
     Uses fixed rotations (7, 13) for SIMD compatibility.
     """
     # Fibonacci-derived constant
-    fib_const = (FIBONACCI[round_num % 12] * 0x9E3779B9) & MASK32
+    fib_const = _FIB_CONSTS[round_num]
 
     # Left edge protection
     state[0] = _rotr(state[0], EDGE_ROT_LEFT)
@@ -168,7 +197,7 @@ def _edge_protection(state: List[int], round_num: int) -> None:
 
     # Right edge protection
     state[7] = _rotl(state[7], EDGE_ROT_RIGHT)
-    state[7] ^= (~fib_const) & MASK32
+    state[7] ^= _FIB_CONSTS_INV[round_num]
 
     # Edge interaction
     interaction = (state[0] ^ state[7]) >> 16
@@ -176,6 +205,36 @@ def _edge_protection(state: List[int], round_num: int) -> None:
     state[7] = (state[7] + interaction) & MASK32
 
 
+def _edge_protection_dual(gc: List[int], round_g: int, round_c: int) -> None:
+    """
+    Edge protection on both streams of a 16-word g || c state in one pass.
+
+    Same result as _edge_protection(g, round_g) followed by
+    _edge_protection(c, round_c); the two streams are independent, so
+    their steps are interleaved.
+    """
+    fib_g = _FIB_CONSTS[round_g]
+    fib_c = _FIB_CONSTS[round_c]
+    left_g, right_g = gc[0], gc[7]
+    left_c, right_c = gc[8], gc[15]
+
+    # Left edges: rotate right, inject constant
+    left_g = (((left_g >> EDGE_ROT_LEFT) | (left_g << (32 - EDGE_ROT_LEFT))) & MASK32) ^ fib_g
+    left_c = (((left_c >> EDGE_ROT_LEFT) | (left_c << (32 - EDGE_ROT_LEFT))) & MASK32) ^ fib_c
+
+    # Right edges: rotate left, inject complemented constant
+    right_g = (((right_g << EDGE_ROT_RIGHT) | (right_g >> (32 - EDGE_ROT_RIGHT))) & MASK32) ^ _FIB_CONSTS_INV[round_g]
+    right_c = (((right_c << EDGE_ROT_RIGHT) | (right_c >> (32 - EDGE_ROT_RIGHT))) & MASK32) ^ _FIB_CONSTS_INV[round_c]
+
+    # Edge interaction
+    inter_g = (left_g ^ right_g) >> 16
+    inter_c = (left_c ^ right_c) >> 16
+    gc[0] = (left_g + inter_g) & MASK32
+    gc[7] = (right_g + inter_g) & MASK32
+    gc[8] = (left_c + inter_c) & MASK32
+    gc[15] = (right_c + inter_c) & MASK32
+
+
 # ============================================================================
 # CROSS-STREAM DIFFUSION
 # ============================================================================
@@ -187,7 +246,7 @@ def _cross_stream_diffusion(g: List[int], c: List[int]) -> None:
     Uses fixed rotation (CROSS_STREAM_ROT = 11) for SIMD compatibility.
     """
     for i in range(STATE_WORDS):
-        temp = (g[i] ^ c[(i + 3) % STATE_WORDS]) & MASK32
+        temp = (g[i] ^ c[_C_ROT_IDX[i]]) & MASK32
         g[i] = (g[i] + _rotr(temp, CROSS_STREAM_ROT)) & MASK32
         c[i] = (c[i] ^ _rotl(temp, CROSS_STREAM_ROT)) & MASK32
 
@@ -196,14 +255,17 @@ def _cross_stream_diffusion(g: List[int], c: List[int]) -> None:
 # MESSAGE EXPANSION
 # ============================================================================
 
-def _expand_message(block: bytes) -> List[int]:
+def _expand_message(block: bytes, offset: int = 0) -> List[int]:
     """
-    Expand 64-byte block to 32 message words.
+    Expand the 64-byte block starting at block[offset] to 32 message words.
 
     Uses simplified expansion similar to SHA-256 but with Fibonacci influence.
+
+    Reference only: hashing uses the generated _expand_inlined or its Numba
+    instance. Kept as the readable specification and for harmonia_ng_test.py.
     """
-    # Parse first 16 words from block
-    w = list(struct.unpack('>16I', block))
+    # Parse first 16 words straight from the buffer (no slice copy)
+    w = list(struct.unpack_from('>16I', block, offset))
 
     # Expand to 32 words
     for i in range(16, NUM_ROUNDS):
@@ -215,7 +277,7 @@ def _expand_message(block: bytes) -> List[int]:
         s1 = _rotr(w[i-2], rot2) ^ _rotr(w[i-2], rot2 + 2) ^ (w[i-2] >> 10)
 
         # Fibonacci factor for quasi-periodic influence
-        fib_factor = FIBONACCI[i % 12]
+        fib_factor = _FIB_BY_ROUND[i]
 
         w.append((w[i-16] + s0 + w[i-7] + s1 + fib_factor) & MASK32)
 
@@ -226,14 +288,20 @@ def _expand_message(block: bytes) -> List[int]:
 # COMPRESSION FUNCTION
 # ============================================================================
 
-def _compress(block: bytes, state_g: List[int], state_c: List[int]) -> Tuple[List[int], List[int]]:
+def _compress(block: bytes, state_g: List[int], state_c: List[int],
+              offset: int = 0) -> Tuple[List[int], List[int]]:
     """
     HARMONIA-NG compression function (32 rounds, SIMD-friendly).
 
-    Processes one 512-bit block and updates the dual-stream state.
+    Processes the 512-bit block at block[offset] and updates the
+    dual-stream state.
+
+    Reference only: hashing uses the generated _compress_inlined or its
+    Numba instance, which add into the state in place. Kept as the readable
+    specification and for harmonia_ng_test.py.
     """
     # Expand message to 32 words
-    w = _expand_message(block)
+    w = _expand_message(block, offset)
 
     # Working copies of state
     g = list(state_g)
@@ -244,8 +312,8 @@ def _compress(block: bytes, state_g: List[int], state_c: List[int]) -> Tuple[Lis
         r1, r2, r3, r4 = ROUND_ROTATIONS[r]
 
         # Get constants for this round
-        k_phi = PHI_CONSTANTS[r % 16]
-        k_rec = RECIPROCAL_CONSTANTS[r % 16]
+        k_phi = _PHI_BY_ROUND[r]
+        k_rec = _REC_BY_ROUND[r]
 
         # Message injection
         g[0] = (g[0] + w[r]) & MASK32
@@ -291,26 +359,28 @@ def _compress(block: bytes, state_g: List[int], state_c: List[int]) -> Tuple[Lis
 # FINALIZATION
 # ============================================================================
 
+# Per-position fusion rotation (i * 3 + 5) % 16 + 1, i.e. 6, 9, 12, 15, 2, 5, 8, 11
+FINAL_ROTATIONS = tuple((i * 3 + 5) % 16 + 1 for i in range(STATE_WORDS))
+
+
 def _finalize(state_g: List[int], state_c: List[int]) -> bytes:
     """
     Finalize and produce the 256-bit digest.
 
     Applies final edge protection and fuses the dual streams.
     """
-    g = list(state_g)
-    c = list(state_c)
+    gc = list(state_g) + list(state_c)
 
-    # Final edge protection
-    _edge_protection(g, NUM_ROUNDS)
-    _edge_protection(c, NUM_ROUNDS + 1)
+    # Final edge protection, both streams at once
+    _edge_protection_dual(gc, NUM_ROUNDS, NUM_ROUNDS + 1)
 
     # Fuse streams with fixed rotations
     digest_words = []
     for i in range(STATE_WORDS):
-        rot = (i * 3 + 5) % 16 + 1  # Rotation 1-16 based on position
+        rot = FINAL_ROTATIONS[i]
 
-        g_rot = _rotr(g[i], rot)
-        c_rot = _rotl(c[i], rot)
+        g_rot = _rotr(gc[i], rot)
+        c_rot = _rotl(gc[STATE_WORDS + i], rot)
 
         fused = (g_rot ^ c_rot) & MASK32
         fused = (fused + PHI_CONSTANTS[i]) & MASK32
@@ -324,29 +394,372 @@ def _finalize(state_g: List[int], state_c: List[int]) -> bytes:
 # PADDING
 # ============================================================================
 
-def _pad_message(message: bytes) -> bytes:
+def _pad_message(message: bytes) -> bytearray:
     """
     Apply Merkle-Damgård padding to the message.
 
-    Appends 0x80, zeros, and 64-bit big-endian length.
+    Appends 0x80, zeros, and 64-bit big-endian length, writing everything
+    into a single buffer allocated at its final size.
     """
     msg_len = len(message)
-    bit_len = msg_len * 8
-
-    # Append 0x80
-    padded = message + b'\x80'
 
     # Pad with zeros until length ≡ 448 (mod 512)
     # That's 56 bytes (mod 64)
     pad_len = (56 - (msg_len + 1) % 64) % 64
-    padded += b'\x00' * pad_len
+
+    padded = bytearray(msg_len + 1 + pad_len + 8)
+    padded[:msg_len] = message
+    padded[msg_len] = 0x80
 
     # Append 64-bit big-endian length
-    padded += struct.pack('>Q', bit_len)
+    struct.pack_into('>Q', padded, len(padded) - 8, msg_len * 8)
 
     return padded
 
 
+# ============================================================================
+# UNROLLED EXPANSION AND ROUNDS (generated)
+# ============================================================================
+
+def _wrap32(expr: str, native: bool, overflows: bool = True) -> str:
+    """Reduce a generated expression to 32 bits (np.uint32 for Numba, else a mask)."""
+    if native:
+        return f'np.uint32({expr})'
+    return f'(({expr}) & 0xFFFFFFFF)' if overflows else expr
+
+
+def _gen_rotl(x: str, n: int, native: bool) -> str:
+    """Generated 32-bit left rotation of x by the literal amount n."""
+    return _wrap32(f'({x} << {n}) | ({x} >> {32 - n})', native)
+
+
+def _gen_expand_source(name: str, native: bool = False) -> str:
+    """
+    Generate `name(w)`: fill w[16..NUM_ROUNDS-1] from w[0..15] in place.
+
+    Same recurrence as _expand_message, with every rotation amount and
+    Fibonacci factor written as a literal.
+    """
+    def rotr(x, n):
+        return _gen_rotl(x, 32 - n, native)
+
+    body = []
+    for i in range(16, NUM_ROUNDS):
+        rot1 = 7 + (i % 5)
+        rot2 = 17 + (i % 4)
+        x, y = f'w[{i - 15}]', f'w[{i - 2}]'
+        s0 = f'({rotr(x, rot1)} ^ {rotr(x, rot1 + 11)} ^ ({x} >> 3))'
+        s1 = f'({rotr(y, rot2)} ^ {rotr(y, rot2 + 2)} ^ ({y} >> 10))'
+        total = f'w[{i - 16}] + {s0} + w[{i - 7}] + {s1} + {_FIB_BY_ROUND[i]}'
+        body.append(f'w[{i}] = ' + _wrap32(total, native))
+    return f'def {name}(w):\n' + ''.join(f'    {line}\n' for line in body)
+
+
+def _gen_rounds_source(name: str, native: bool = False) -> str:
+    """
+    Generate `name(s, w)`: all NUM_ROUNDS rounds of the compression as
+    straight-line code over the locals g0..g7, c0..c7.
+
+    s holds g[0..7] followed by c[0..7] and receives the Davies-Meyer sum;
+    w is the expanded message. Rotation amounts, round constants, word
+    indices and edge-protection constants are literals, and cross-stream
+    diffusion and edge protection are emitted only after the rounds that
+    use them. Each quarter-round step is written for the four independent
+    lanes (two per stream) back to back.
+
+    With native=True every assignment is wrapped in np.uint32() so Numba
+    keeps the locals 32-bit; otherwise results are masked with & MASK32
+    where they can exceed 32 bits.
+    """
+    def wrap(expr, overflows=True):
+        return _wrap32(expr, native, overflows)
+
+    def rotl(x, n):
+        return _gen_rotl(x, n, native)
+
+    def rotr(x, n):
+        return rotl(x, 32 - n)
+
+    def add(x, y):
+        return f'{x} = ' + wrap(f'{x} + {y}')
+
+    def xor(x, y):
+        return f'{x} = ' + wrap(f'{x} ^ {y}', overflows=False)
+
+    # (a, b, c, d) per lane: columns, then diagonals, for both streams
+    columns = [(f'{p}{a}', f'{p}{b}', f'{p}{c}', f'{p}{d}')
+               for p in 'gc' for a, b, c, d in ((0, 1, 2, 3), (4, 5, 6, 7))]
+    diagonals = [(f'{p}{a}', f'{p}{b}', f'{p}{c}', f'{p}{d}')
+                 for p in 'gc' for a, b, c, d in ((0, 5, 2, 7), (4, 1, 6, 3))]
+    words = [f'g{i}' for i in range(STATE_WORDS)] + [f'c{i}' for i in range(STATE_WORDS)]
+
+    body = [f'{v} = s[{i}]' for i, v in enumerate(words)]
+
+    for r in range(NUM_ROUNDS):
+        r1, r2, r3, r4 = ROUND_ROTATIONS[r]
+        body += [
+            f'# round {r}',
+            add('g0', f'w[{r}]'),
+            add('c0', f'w[{NUM_ROUNDS - 1 - r}]'),
+            xor('g4', f'0x{_PHI_BY_ROUND[r]:08X}'),
+            xor('c4', f'0x{_REC_BY_ROUND[r]:08X}'),
+        ]
+        for lanes in (columns, diagonals):
+            for x, y, z, rot in ((0, 1, 3, r1), (2, 3, 1, r2), (0, 1, 3, r3), (2, 3, 1, r4)):
+                # x += y; z ^= x; z <<<= rot, on every lane
+                body += [add(q[x], q[y]) for q in lanes]
+                for q in lanes:
+                    body += ['t = ' + wrap(f'{q[z]} ^ {q[x]}', overflows=False),
+                             f'{q[z]} = ' + rotl('t', rot)]
+
+        if (r + 1) % 4 == 0:
+            for i in range(STATE_WORDS):
+                body += [
+                    't = ' + wrap(f'g{i} ^ c{_C_ROT_IDX[i]}', overflows=False),
+                    add(f'g{i}', rotr('t', CROSS_STREAM_ROT)),
+                    xor(f'c{i}', rotl('t', CROSS_STREAM_ROT)),
+                ]
+
+        if (r + 1) % 8 == 0:
+            for p in 'gc':
+                left = rotr(f'{p}0', EDGE_ROT_LEFT)
+                right = rotl(f'{p}7', EDGE_ROT_RIGHT)
+                body += [
+                    f'{p}0 = ' + wrap(f'{left} ^ 0x{_FIB_CONSTS[r]:08X}', overflows=False),
+                    f'{p}7 = ' + wrap(f'{right} ^ 0x{_FIB_CONSTS_INV[r]:08X}', overflows=False),
+                    't = ' + wrap(f'({p}0 ^ {p}7) >> 16', overflows=False),
+                    add(f'{p}0', 't'),
+                    add(f'{p}7', 't'),
+                ]
+
+    body += [f's[{i}] = ' + wrap(f's[{i}] + {v}') for i, v in enumerate(words)]
+    return f'def {name}(s, w):\n' + ''.join(f'    {line}\n' for line in body)
+
+
+# Pure-Python instances: every quarter-round, rotation and schedule lookup
+# is inlined, so a block costs two calls instead of thousands.
+_ns = {}
+exec(compile(_gen_expand_source('_expand_inlined'), '<harmonia_ng expansion>', 'exec'), _ns)
+exec(compile(_gen_rounds_source('_compress_inlined'), '<harmonia_ng rounds>', 'exec'), _ns)
+_expand_inlined = _ns['_expand_inlined']
+_compress_inlined = _ns['_compress_inlined']
+del _ns
+
+
+# ============================================================================
+# COMPILED BACKEND (optional, requires Numba)
+# ============================================================================
+#
+# Mirrors the pure-Python compression on uint32 values, so additions wrap
+# modulo 2^32 without explicit masking. Expansion and rounds are the
+# generated straight-line code above. Numba compiles them once on first
+# use, which takes a while, and caches the result on disk.
+
+_HAVE_NUMBA = njit is not None
+
+if _HAVE_NUMBA:
+    _ns = {'np': np}
+    exec(compile(_gen_expand_source('_expand_nb', native=True), '<harmonia_ng expansion>', 'exec'), _ns)
+    exec(compile(_gen_rounds_source('_rounds_nb', native=True), '<harmonia_ng rounds>', 'exec'), _ns)
+    _expand_nb = njit(_ns['_expand_nb'])
+    _rounds_nb = njit(_ns['_rounds_nb'])
+    del _ns
+
+    _INITIAL_STATE_NP = np.array(INITIAL_HASH_G + INITIAL_HASH_C, dtype=np.uint32)
+
+    @njit(cache=True, boundscheck=False)
+    def _compress_nb(block_words, state, w):
+        """
+        Compress one block of 16 uint32 words into state in place.
+
+        state is a uint32[16] buffer holding g[0..7] followed by c[0..7];
+        w is a uint32[NUM_ROUNDS] schedule scratch buffer. Expansion and
+        rounds run as the generated straight-line `_expand_nb` and
+        `_rounds_nb`, whose uint32 locals LLVM keeps in registers.
+        """
+        w[:16] = block_words
+        _expand_nb(w)
+        _rounds_nb(state, w)
+
+    @njit(cache=True)
+    def _compress_blocks_nb(words, state, w):
+        """Run `_compress_nb` over every 16-word block with the schedule buffer w."""
+        for off in range(0, words.shape[0], 16):
+            _compress_nb(words[off:off + 16], state, w)
+
+    _FIN_ROT_NP = np.array(FINAL_ROTATIONS, dtype=np.uint32)
+    _FIN_ROT_INV_NP = np.uint32(32) - _FIN_ROT_NP
+    _FIN_PHI_NP = np.array(PHI_CONSTANTS[:STATE_WORDS], dtype=np.uint32)
+    _EDGE_FIB_NP = np.array(_FIB_CONSTS, dtype=np.uint32)
+    _EDGE_FIB_INV_NP = np.array(_FIB_CONSTS_INV, dtype=np.uint32)
+    _EDGE_ROT_NP = np.array([EDGE_ROT_LEFT, 32 - EDGE_ROT_LEFT,
+                             EDGE_ROT_RIGHT, 32 - EDGE_ROT_RIGHT, 16], dtype=np.uint32)
+
+    @njit(cache=True)
+    def _edge_protection_dual_nb(s, round_g, round_c):
+        """
+        Edge protection on both streams of a uint32[16] g||c state, in
+        place: the left edges s[0], s[8] and right edges s[7], s[15] are
+        each handled as one 2-wide array op.
+        """
+        fib = np.empty(2, dtype=np.uint32)
+        fib_inv = np.empty(2, dtype=np.uint32)
+        fib[0] = _EDGE_FIB_NP[round_g]
+        fib[1] = _EDGE_FIB_NP[round_c]
+        fib_inv[0] = _EDGE_FIB_INV_NP[round_g]
+        fib_inv[1] = _EDGE_FIB_INV_NP[round_c]
+        left = s[0::STATE_WORDS]
+        right = s[STATE_WORDS - 1::STATE_WORDS]
+
+        left = ((left >> _EDGE_ROT_NP[0]) | (left << _EDGE_ROT_NP[1])) ^ fib
+        right = ((right << _EDGE_ROT_NP[2]) | (right >> _EDGE_ROT_NP[3])) ^ fib_inv
+
+        interaction = (left ^ right) >> _EDGE_ROT_NP[4]
+        s[0::STATE_WORDS] = left + interaction
+        s[STATE_WORDS - 1::STATE_WORDS] = right + interaction
+
+    @njit(cache=True)
+    def _finalize_nb(state):
+        """
+        Digest words of a uint32[16] g||c state: final edge protection on
+        both streams, then the rotate/XOR/add fusion as 8-wide array ops.
+        """
+        s = state.copy()
+        _edge_protection_dual_nb(s, NUM_ROUNDS, NUM_ROUNDS + 1)
+
+        g = s[:STATE_WORDS]
+        c = s[STATE_WORDS:]
+        g_rot = (g >> _FIN_ROT_NP) | (g << _FIN_ROT_INV_NP)
+        c_rot = (c << _FIN_ROT_NP) | (c >> _FIN_ROT_INV_NP)
+        return (g_rot ^ c_rot) + _FIN_PHI_NP
+
+    @njit(cache=True)
+    def _digest_1block_nb(block):
+        """
+        Digest words of a message padded to exactly one block, given as
+        uint8[64]: the words are assembled big-endian in the kernel so the
+        whole hash is a single compiled call.
+        """
+        words = np.empty(16, dtype=np.uint32)
+        for i in range(16):
+            words[i] = ((np.uint32(block[4 * i]) << 24) | (np.uint32(block[4 * i + 1]) << 16)
+                        | (np.uint32(block[4 * i + 2]) << 8) | np.uint32(block[4 * i + 3]))
+        state = _INITIAL_STATE_NP.copy()
+        _compress_nb(words, state, np.empty(NUM_ROUNDS, dtype=np.uint32))
+        return _finalize_nb(state)
+
+    @njit(cache=True, parallel=True)
+    def _compress_batch_nb(words, offsets, states):
+        """
+        Compress independent messages in parallel, one per thread.
+
+        Message m's padded words are words[offsets[m]:offsets[m + 1]] and
+        its g||c state is the row states[m].
+        """
+        for m in prange(states.shape[0]):
+            w = np.empty(NUM_ROUNDS, dtype=np.uint32)
+            state = states[m]
+            for off in range(offsets[m], offsets[m + 1], 16):
+                _compress_nb(words[off:off + 16], state, w)
+
+
+# ============================================================================
+# NATIVE LIBRARY (optional, built with `make python-ng-lib`)
+# ============================================================================
+#
+# harmonia_ng.c already implements the full hash; when its shared library
+# sits next to this module, one-shot hashing goes straight to the C code.
+
+_LIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libharmonia_ng.so')
+
+try:
+    _lib = ctypes.CDLL(_LIB_PATH)
+except OSError:
+    _lib = None
+
+if _lib is not None:
+    _lib.harmonia_ng.argtypes = (ctypes.c_char_p, ctypes.c_size_t, ctypes.c_char_p)
+    _lib.harmonia_ng.restype = None
+
+    def _harmonia_ng_native(message: bytes) -> bytes:
+        """Hash a message with the C implementation."""
+        message = bytes(message)
+        digest = ctypes.create_string_buffer(DIGEST_SIZE)
+        _lib.harmonia_ng(message, len(message), digest)
+        return digest.raw
+else:
+    _harmonia_ng_native = None
+
+
+# ============================================================================
+# BLOCK PROCESSING
+# ============================================================================
+#
+# State is the 16 chaining words g || c: a uint32 array for the compiled
+# kernels, a list of ints for the generated pure-Python rounds. Rounds run
+# on locals and add into the state in place (Davies-Meyer), and the message
+# schedule w is a scratch buffer the caller keeps across blocks, so no
+# per-block buffers are allocated.
+
+def _initial_state():
+    """Return a fresh chaining state for the active backend."""
+    if _HAVE_NUMBA:
+        return _INITIAL_STATE_NP.copy()
+    return list(INITIAL_HASH_G + INITIAL_HASH_C)
+
+
+def _schedule_buffer():
+    """Return a message schedule scratch buffer for the active backend."""
+    if _HAVE_NUMBA:
+        return np.empty(NUM_ROUNDS, dtype=np.uint32)
+    return [0] * NUM_ROUNDS
+
+
+def _compress_blocks(state, w, data, start: int, stop: int) -> None:
+    """Compress the whole blocks data[start:stop] into state, in place."""
+    if _HAVE_NUMBA:
+        words = np.frombuffer(data, dtype='>u4', count=(stop - start) // 4, offset=start)
+        _compress_blocks_nb(words.astype(np.uint32), state, w)
+        return
+
+    # Process blocks with the generated equivalent of _compress
+    for i in range(start, stop, BLOCK_SIZE):
+        w[:16] = struct.unpack_from('>16I', data, i)
+        _expand_inlined(w)
+        _compress_inlined(state, w)
+
+
+def _finalize_state(state) -> bytes:
+    """Produce the digest from a chaining state without modifying it."""
+    if _HAVE_NUMBA:
+        return _finalize_nb(state).astype('>u4').tobytes()
+    return _finalize(state[:STATE_WORDS], state[STATE_WORDS:])
+
+
+def _harmonia_1block(message: bytes) -> bytes:
+    """
+    harmonia_ng for messages of at most 55 bytes, which pad to one block.
+
+    The padding is written straight into a single 64-byte block and the
+    hash is one compression and finalization, with no block loop.
+    """
+    n = len(message)
+    block = bytearray(BLOCK_SIZE)
+    block[:n] = message
+    block[n] = 0x80
+    struct.pack_into('>Q', block, BLOCK_SIZE - 8, n * 8)
+
+    if _HAVE_NUMBA:
+        return _digest_1block_nb(np.frombuffer(block, dtype=np.uint8)).astype('>u4').tobytes()
+
+    state = list(INITIAL_HASH_G + INITIAL_HASH_C)
+    w = [0] * NUM_ROUNDS
+    w[:16] = struct.unpack('>16I', block)
+    _expand_inlined(w)
+    _compress_inlined(state, w)
+    return _finalize(state[:STATE_WORDS], state[STATE_WORDS:])
+
+
 # ============================================================================
 # PUBLIC API
 # ============================================================================
@@ -361,20 +774,19 @@ def harmonia_ng(message: bytes) -> bytes:
     Returns:
         32-byte (256-bit) digest
     """
-    # Initialize state
-    state_g = list(INITIAL_HASH_G)
-    state_c = list(INITIAL_HASH_C)
+    if _harmonia_ng_native is not None:
+        return _harmonia_ng_native(message)
+
+    # Inputs of up to 55 bytes pad to a single block
+    if len(message) <= BLOCK_SIZE - 9:
+        return _harmonia_1block(message)
 
     # Pad message
     padded = _pad_message(message)
 
-    # Process blocks
-    for i in range(0, len(padded), BLOCK_SIZE):
-        block = padded[i:i + BLOCK_SIZE]
-        state_g, state_c = _compress(block, state_g, state_c)
-
-    # Finalize
-    return _finalize(state_g, state_c)
+    state = _initial_state()
+    _compress_blocks(state, _schedule_buffer(), padded, 0, len(padded))
+    return _finalize_state(state)
 
 
 def harmonia_ng_hex(message: bytes) -> str:
@@ -390,6 +802,116 @@ def harmonia_ng_hex(message: bytes) -> str:
     return harmonia_ng(message).hex()
 
 
+class Harmonia:
+    """
+    Incremental HARMONIA-NG hasher with a hashlib-style interface.
+
+    Complete blocks are compressed as data arrives; only a partial block
+    is buffered, so memory use does not grow with the message length.
+
+    Example:
+        >>> h = Harmonia()
+        >>> h.update(b"Harmo")
+        >>> h.update(b"nia")
+        >>> h.digest() == harmonia_ng(b"Harmonia")
+        True
+    """
+
+    name = 'harmonia-ng'
+    digest_size = DIGEST_SIZE
+    block_size = BLOCK_SIZE
+
+    def __init__(self, data: bytes = b''):
+        self._state = _initial_state()
+        self._w = _schedule_buffer()
+        self._buf = bytearray(BLOCK_SIZE)
+        self._buf_len = 0
+        self._total_len = 0
+        if data:
+            self.update(data)
+
+    def update(self, data: bytes) -> None:
+        """Feed more message bytes into the hash."""
+        data = memoryview(data).cast('B')
+        n = len(data)
+        self._total_len += n
+        pos = 0
+
+        # Top up a previously buffered partial block first
+        if self._buf_len:
+            pos = min(BLOCK_SIZE - self._buf_len, n)
+            self._buf[self._buf_len:self._buf_len + pos] = data[:pos]
+            self._buf_len += pos
+            if self._buf_len < BLOCK_SIZE:
+                return
+            _compress_blocks(self._state, self._w, self._buf, 0, BLOCK_SIZE)
+            self._buf_len = 0
+
+        # Compress whole blocks straight from the input, buffer the tail
+        end = pos + (n - pos) // BLOCK_SIZE * BLOCK_SIZE
+        if end > pos:
+            _compress_blocks(self._state, self._w, data, pos, end)
+        self._buf[:n - end] = data[end:]
+        self._buf_len = n - end
+
+    def digest(self) -> bytes:
+        """Return the digest of the data fed so far; the hasher stays usable."""
+        # Same padding as _pad_message, applied to the buffered tail only
+        tail_len = BLOCK_SIZE if self._buf_len < BLOCK_SIZE - 8 else 2 * BLOCK_SIZE
+        tail = bytearray(tail_len)
+        tail[:self._buf_len] = self._buf[:self._buf_len]
+        tail[self._buf_len] = 0x80
+        struct.pack_into('>Q', tail, tail_len - 8, self._total_len * 8)
+
+        state = self._state.copy()
+        _compress_blocks(state, self._w, tail, 0, tail_len)
+        return _finalize_state(state)
+
+    def hexdigest(self) -> str:
+        """Return the digest as a hexadecimal string."""
+        return self.digest().hex()
+
+    def copy(self) -> 'Harmonia':
+        """Return an independent hasher with the same internal state."""
+        other = Harmonia.__new__(Harmonia)
+        other._state = self._state.copy()
+        other._w = _schedule_buffer()
+        other._buf = self._buf[:]
+        other._buf_len = self._buf_len
+        other._total_len = self._total_len
+        return other
+
+
+def harmonia_ng_batch(messages: List[bytes]) -> List[bytes]:
+    """
+    Compute HARMONIA-NG digests of many independent messages.
+
+    Merkle-Damgård chaining keeps a single message serial, but separate
+    messages are independent: with Numba they are all compressed in one
+    call to a multithreaded kernel. Without Numba this is equivalent to
+    [harmonia_ng(m) for m in messages].
+
+    Args:
+        messages: Input byte strings to hash
+
+    Returns:
+        List of 32-byte digests, in the same order
+    """
+    if not _HAVE_NUMBA:
+        return [harmonia_ng(message) for message in messages]
+
+    padded = [_pad_message(message) for message in messages]
+
+    offsets = np.zeros(len(padded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(p) // 4 for p in padded])
+    words = np.frombuffer(b''.join(padded), dtype='>u4').astype(np.uint32)
+    states = np.tile(_INITIAL_STATE_NP, (len(padded), 1))
+
+    _compress_batch_nb(words, offsets, states)
+
+    return [_finalize_nb(state).astype('>u4').tobytes() for state in states]
+
+
 # ============================================================================
 # SELF-TEST
 # ============================================================================
@@ -17,6 +17,8 @@ import time
 from typing import List, Tuple, Dict
 from collections import Counter
 
+import numpy as np
+
 # Import HARMONIA implementations
 from harmonia_ng import harmonia_ng, harmonia_ng_hex, NUM_ROUNDS as NG_ROUNDS
 from harmonia import harmonia, harmonia_hex
@@ -26,9 +28,16 @@ from harmonia import harmonia, harmonia_hex
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# Popcount of every byte value
+_POPCNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
 def hamming_distance(a: bytes, b: bytes) -> int:
     """Count differing bits between two byte sequences."""
-    return sum(bin(x ^ y).count('1') for x, y in zip(a, b))
+    n = min(len(a), len(b))
+    x = np.frombuffer(a, dtype=np.uint8, count=n)
+    y = np.frombuffer(b, dtype=np.uint8, count=n)
+    return int(_POPCNT8[x ^ y].sum(dtype=np.int64))
 
 
 def flip_bit(data: bytes, bit_pos: int) -> bytes:
@@ -58,35 +67,32 @@ def test_avalanche_effect(hash_func, name: str, num_samples: int = 1000) -> Dict
     print(f"Avalanche Effect Test: {name}")
     print(f"{'='*60}")
 
-    bit_changes = []
+    # Digest pairs as rows of two (num_samples, 32) byte matrices
+    orig = np.empty((num_samples, 32), dtype=np.uint8)
+    flipped = np.empty((num_samples, 32), dtype=np.uint8)
 
-    for _ in range(num_samples):
+    for s in range(num_samples):
         # Generate random message
         msg_len = random.randint(1, 128)
         msg = os.urandom(msg_len)
 
-        # Compute original hash
-        hash1 = hash_func(msg)
-
         # Flip random bit
         bit_pos = random.randint(0, len(msg) * 8 - 1)
         msg_flipped = flip_bit(msg, bit_pos)
 
-        # Compute hash of flipped message
-        hash2 = hash_func(msg_flipped)
+        orig[s] = np.frombuffer(hash_func(msg), dtype=np.uint8)
+        flipped[s] = np.frombuffer(hash_func(msg_flipped), dtype=np.uint8)
 
-        # Count bit changes
-        diff = hamming_distance(hash1, hash2)
-        bit_changes.append(diff)
+    # Count bit changes for all pairs at once
+    bit_changes = _POPCNT8[orig ^ flipped].sum(axis=1, dtype=np.int64)
 
     # Statistics
-    mean_diff = sum(bit_changes) / len(bit_changes)
-    min_diff = min(bit_changes)
-    max_diff = max(bit_changes)
+    mean_diff = float(bit_changes.mean())
+    min_diff = int(bit_changes.min())
+    max_diff = int(bit_changes.max())
 
     # Standard deviation
-    variance = sum((x - mean_diff) ** 2 for x in bit_changes) / len(bit_changes)
-    std_dev = variance ** 0.5
+    std_dev = float(bit_changes.std())
 
     # Percentage
     mean_percent = mean_diff / 256 * 100
@@ -123,16 +129,14 @@ def test_bit_distribution(hash_func, name: str, num_samples: int = 1000) -> Dict
     print(f"Bit Distribution Test: {name}")
     print(f"{'='*60}")
 
-    total_bits = 0
-    total_ones = 0
+    digests = np.empty((num_samples, 32), dtype=np.uint8)
 
     for i in range(num_samples):
         msg = os.urandom(random.randint(1, 256))
-        digest = hash_func(msg)
+        digests[i] = np.frombuffer(hash_func(msg), dtype=np.uint8)
 
-        ones = sum(bin(b).count('1') for b in digest)
-        total_ones += ones
-        total_bits += 256
+    total_bits = num_samples * 256
+    total_ones = int(_POPCNT8[digests].sum(dtype=np.int64))
 
     percent_ones = total_ones / total_bits * 100
     deviation = abs(percent_ones - 50.0)
@@ -236,20 +240,20 @@ def test_reduced_rounds_ng() -> Dict:
     print(f"  {'-'*40}")
 
     for rounds in round_counts:
-        diffs = []
         num_samples = 100
+        h1 = np.empty((num_samples, 32), dtype=np.uint8)
+        h2 = np.empty((num_samples, 32), dtype=np.uint8)
 
-        for _ in range(num_samples):
+        for s in range(num_samples):
             msg = os.urandom(32)
-            h1 = hash_reduced(msg, rounds)
+            h1[s] = np.frombuffer(hash_reduced(msg, rounds), dtype=np.uint8)
 
             msg_flipped = flip_bit(msg, random.randint(0, 255))
-            h2 = hash_reduced(msg_flipped, rounds)
-
-            diffs.append(hamming_distance(h1, h2))
+            h2[s] = np.frombuffer(hash_reduced(msg_flipped, rounds), dtype=np.uint8)
 
-        mean_diff = sum(diffs) / len(diffs)
-        min_diff = min(diffs)
+        diffs = _POPCNT8[h1 ^ h2].sum(axis=1, dtype=np.int64)
+        mean_diff = float(diffs.mean())
+        min_diff = int(diffs.min())
         percent = mean_diff / 256 * 100
 
         status = "SECURE" if percent >= 45.0 else "WEAK"
@@ -0,0 +1,350 @@
+/*
+ * HARMONIA-XOF - Sponge permutation
+ *
+ * Native implementation of the HARMONIA-XOF permutation together with the
+ * sponge's absorb and squeeze loops. harmonia_xof.py loads it through
+ * ctypes when the shared library is present (make python-xof-lib).
+ *
+ * The sponge state is 16 words: the rate stream g[0..7] followed by the
+ * capacity stream c[0..7]. When compiled with AVX2 (-march=native on x86-64)
+ * the mixing step runs on 256-bit vectors; otherwise it is plain scalar C.
+ *
+ * License: MIT
+ */
+
+#include <stdint.h>
+#include <stddef.h>
+
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+/* Apply `rounds` (at most 65) permutation rounds to the state in place */
+void harmonia_xof_permute(uint32_t *state, int rounds);
+
+/* XOR each 32-byte block of data into g and permute */
+void harmonia_xof_absorb(uint32_t *state, const uint8_t *data, size_t nblocks, int rounds);
+
+/* Write g as nblocks output blocks, permuting between consecutive blocks */
+void harmonia_xof_squeeze(uint32_t *state, uint8_t *out, size_t nblocks, int rounds);
+
+/* ============================================================================
+ * CONSTANTS
+ * ============================================================================ */
+
+/* Golden ratio derived constants */
+static const uint32_t PHI_CONSTANTS[16] = {
+    0x9E37605A, 0xDAC1E0F2, 0xF287A338, 0xFA8CFC04,
+    0xFD805AA6, 0xCCF29760, 0xFF8184C3, 0xFF850D11,
+    0xCC32476B, 0x98767486, 0xFFF82080, 0x30E4E2F3,
+    0xFCC3ACC1, 0xE5216F38, 0xF30E4CC9, 0x948395F6
+};
+
+/* Reciprocal constants */
+static const uint32_t RECIPROCAL_CONSTANTS[16] = {
+    0x7249217F, 0x5890EB7C, 0x4786B47C, 0x4C51DBE8,
+    0x4E4DA61B, 0x4F76650C, 0x4F2F1A2A, 0x4F6CE289,
+    0x4F1ADF40, 0x4E84BABC, 0x4F22D993, 0x497FA704,
+    0x4F514F19, 0x4E8F43B8, 0x508E2FD9, 0x4B5F94A4
+};
+
+/* Fibonacci sequence */
+static const uint32_t FIBONACCI[12] = {
+    1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144
+};
+
+/* Fibonacci word for round scheduling (A=1, B=0) */
+static const uint8_t FIBONACCI_WORD[64] = {
+    1,0,1,1,0,1,0,1,1,0,1,1,0,1,0,1,
+    1,0,1,0,1,1,0,1,1,0,1,0,1,1,0,1,
+    1,0,1,0,1,1,0,1,0,1,1,0,1,1,0,1,
+    0,1,1,0,1,1,0,1,0,1,1,0,1,0,1,1
+};
+
+/* Pre-computed quasicrystal rotation table [66][10] (same as harmonia.c) */
+static const uint8_t QUASICRYSTAL_ROTATIONS[66][10] = {
+    {14, 11, 5, 4, 11, 13, 11, 5, 3, 10},
+    {5, 11, 13, 11, 4, 5, 11, 13, 11, 5},
+    {20, 6, 11, 2, 5, 21, 7, 10, 1, 5},
+    {14, 18, 7, 7, 17, 14, 18, 9, 9, 15},
+    {6, 12, 18, 1, 3, 10, 9, 16, 2, 6},
+    {16, 2, 6, 14, 13, 18, 6, 11, 10, 11},
+    {19, 15, 14, 17, 3, 12, 12, 16, 2, 12},
+    {16, 20, 6, 12, 4, 7, 6, 16, 8, 9},
+    {16, 1, 6, 6, 21, 11, 10, 5, 5, 4},
+    {14, 16, 16, 5, 12, 19, 11, 10, 21, 2},
+    {11, 16, 14, 9, 17, 20, 8, 19, 10, 10},
+    {18, 3, 10, 13, 13, 1, 20, 20, 18, 4},
+    {4, 5, 11, 13, 11, 5, 4, 11, 13, 11},
+    {13, 10, 3, 5, 12, 13, 11, 4, 5, 11},
+    {12, 3, 5, 19, 5, 11, 2, 5, 20, 7},
+    {5, 5, 20, 15, 18, 7, 6, 18, 14, 18},
+    {20, 21, 21, 5, 14, 18, 1, 2, 8, 11},
+    {3, 20, 15, 16, 21, 4, 16, 14, 17, 5},
+    {10, 6, 10, 1, 16, 13, 14, 1, 15, 13},
+    {21, 17, 18, 11, 5, 11, 14, 2, 2, 12},
+    {20, 17, 2, 17, 18, 19, 15, 7, 13, 6},
+    {21, 1, 7, 7, 5, 18, 19, 19, 13, 1},
+    {11, 19, 2, 19, 15, 17, 3, 20, 8, 7},
+    {13, 10, 16, 20, 3, 8, 18, 8, 5, 2},
+    {12, 13, 10, 4, 5, 11, 13, 11, 4, 5},
+    {2, 6, 12, 13, 10, 3, 6, 12, 13, 10},
+    {5, 18, 4, 13, 3, 5, 19, 5, 12, 2},
+    {1, 16, 17, 5, 4, 20, 15, 18, 6, 6},
+    {17, 1, 17, 20, 21, 20, 3, 15, 19, 1},
+    {17, 13, 15, 5, 1, 16, 15, 20, 2, 18},
+    {1, 10, 19, 8, 3, 14, 4, 17, 12, 11},
+    {9, 15, 3, 4, 18, 16, 6, 10, 15, 15},
+    {2, 21, 3, 12, 5, 8, 19, 14, 11, 3},
+    {1, 15, 17, 1, 14, 14, 21, 15, 19, 12},
+    {2, 12, 20, 13, 13, 2, 5, 14, 19, 18},
+    {15, 10, 19, 10, 15, 10, 21, 3, 7, 2},
+    {10, 3, 6, 12, 13, 10, 3, 6, 12, 13},
+    {12, 13, 9, 2, 7, 12, 13, 10, 3, 6},
+    {2, 15, 4, 5, 18, 3, 13, 3, 5, 19},
+    {16, 2, 1, 2, 16, 17, 4, 3, 21, 15},
+    {21, 21, 19, 16, 2, 19, 20, 20, 18, 2},
+    {9, 12, 7, 18, 12, 13, 7, 3, 17, 14},
+    {21, 3, 14, 5, 13, 20, 7, 21, 17, 6},
+    {2, 18, 20, 6, 10, 9, 8, 18, 13, 1},
+    {6, 3, 15, 8, 1, 19, 3, 14, 15, 20},
+    {6, 1, 5, 8, 8, 5, 1, 6, 1, 15},
+    {2, 7, 17, 21, 18, 18, 14, 6, 2, 12},
+    {4, 4, 9, 9, 8, 15, 6, 19, 4, 21},
+    {7, 12, 13, 10, 2, 6, 12, 13, 10, 3},
+    {9, 1, 7, 12, 13, 9, 2, 7, 12, 13},
+    {4, 4, 16, 1, 15, 4, 5, 17, 2, 14},
+    {3, 4, 17, 16, 2, 1, 2, 16, 17, 3},
+    {18, 12, 7, 1, 1, 19, 15, 4, 20, 21},
+    {12, 19, 9, 7, 14, 9, 18, 12, 12, 9},
+    {3, 17, 21, 21, 1, 11, 8, 15, 20, 5},
+    {21, 17, 13, 7, 21, 21, 4, 5, 14, 12},
+    {3, 6, 1, 1, 15, 3, 14, 1, 14, 16},
+    {15, 21, 15, 14, 1, 17, 15, 1, 14, 1},
+    {17, 13, 5, 21, 8, 9, 20, 3, 16, 16},
+    {2, 3, 8, 18, 18, 13, 2, 6, 11, 1},
+    {13, 9, 1, 7, 12, 13, 9, 2, 7, 12},
+    {8, 13, 13, 8, 1, 8, 13, 13, 9, 2},
+    {15, 2, 17, 4, 4, 16, 1, 15, 4, 4},
+    {18, 15, 20, 4, 5, 17, 16, 1, 2, 3},
+    {12, 5, 2, 17, 11, 8, 2, 1, 18, 14},
+    {6, 21, 1, 14, 20, 8, 5, 17, 10, 19}
+};
+
+/* ============================================================================
+ * PRIMITIVE OPERATIONS
+ * ============================================================================ */
+
+#define ROTR32(x, n) (((x) >> (n)) | ((x) << (32 - (n))))
+#define ROTL32(x, n) (((x) << (n)) | ((x) >> (32 - (n))))
+
+static inline uint32_t load_be32(const uint8_t *p) {
+    return ((uint32_t)p[0] << 24) | ((uint32_t)p[1] << 16) |
+           ((uint32_t)p[2] << 8) | (uint32_t)p[3];
+}
+
+static inline void store_be32(uint8_t *p, uint32_t v) {
+    p[0] = (uint8_t)(v >> 24);
+    p[1] = (uint8_t)(v >> 16);
+    p[2] = (uint8_t)(v >> 8);
+    p[3] = (uint8_t)v;
+}
+
+/* ============================================================================
+ * MIXING FUNCTIONS
+ * ============================================================================ */
+
+static inline void mix_golden(uint32_t *a, uint32_t *b, uint32_t k, int r, int i) {
+    uint32_t va = *a, vb = *b, mix;
+
+    va = ROTR32(va, QUASICRYSTAL_ROTATIONS[r][i]);
+    va = (va + vb) ^ k;
+
+    vb = ROTL32(vb, QUASICRYSTAL_ROTATIONS[r + 1][i + 1]);
+    vb = (vb ^ va) + k;
+
+    mix = (va * 3) ^ (vb * 5);
+    *a = va ^ (mix >> 11);
+    *b = vb ^ (mix << 7);
+}
+
+static inline void mix_complementary(uint32_t *a, uint32_t *b, uint32_t k, int r, int i) {
+    uint32_t va = *a, vb = *b;
+
+    va = ROTL32(va ^ vb, QUASICRYSTAL_ROTATIONS[r][i]) + (k >> 1);
+
+    vb = ROTR32(vb + va, QUASICRYSTAL_ROTATIONS[r + 1][i + 1]) ^ (k >> 1);
+
+    *a = va;
+    *b = vb;
+}
+
+static inline void edge_protection(uint32_t *s, int r) {
+    uint32_t fib_const = FIBONACCI[r % 12] * 0x9E3779B9U;
+    uint32_t left = ROTR32(s[0], QUASICRYSTAL_ROTATIONS[r][0]) ^ fib_const;
+    uint32_t right = ROTL32(s[7], QUASICRYSTAL_ROTATIONS[r][7]) ^ ~fib_const;
+    uint32_t interaction = (left ^ right) >> 16;
+
+    s[0] = left + interaction;
+    s[7] = right + interaction;
+}
+
+/* ============================================================================
+ * PERMUTATION AND SPONGE
+ * ============================================================================ */
+
+/* Edge protection every 8 rounds, then cross-stream diffusion every 4 rounds */
+static inline void diffuse(uint32_t *g, uint32_t *c, int r) {
+    int i;
+
+    if ((r & 7) == 0) {
+        edge_protection(g, r);
+        edge_protection(c, r);
+    }
+
+    /* In word order: words 5..7 read the already-updated c[0..2] */
+    uint32_t rot = QUASICRYSTAL_ROTATIONS[r][4];
+    for (i = 0; i < 8; i++) {
+        uint32_t temp = g[i] ^ c[(i + 3) & 7];
+        g[i] += ROTR32(temp, rot);
+        c[i] ^= ROTL32(temp, rot);
+    }
+}
+
+#ifdef __AVX2__
+
+/*
+ * The four (i, i + 4) mixes of both streams run as one 8-lane sequence:
+ * lo = g[0..3] | c[0..3] and hi = g[4..7] | c[4..7]. With that packing the
+ * per-lane rotation amounts are exactly QUASICRYSTAL_ROTATIONS[r][0..7] for
+ * the first operand and QUASICRYSTAL_ROTATIONS[r + 1][1..8] for the second,
+ * and the round constant is k_phi in the g half and k_rec in the c half.
+ * The state is spilled to memory for the scalar edge / cross-stream step.
+ */
+
+#if defined(__AVX512F__) && defined(__AVX512VL__)
+#define ROTRV(x, n) _mm256_rorv_epi32((x), (n))
+#define ROTLV(x, n) _mm256_rolv_epi32((x), (n))
+#else
+#define ROTRV(x, n) _mm256_or_si256(_mm256_srlv_epi32((x), (n)), \
+        _mm256_sllv_epi32((x), _mm256_sub_epi32(_mm256_set1_epi32(32), (n))))
+#define ROTLV(x, n) _mm256_or_si256(_mm256_sllv_epi32((x), (n)), \
+        _mm256_srlv_epi32((x), _mm256_sub_epi32(_mm256_set1_epi32(32), (n))))
+#endif
+
+static inline __m256i load_rotations(int r, int first) {
+    return _mm256_cvtepu8_epi32(_mm_loadl_epi64((const __m128i *)&QUASICRYSTAL_ROTATIONS[r][first]));
+}
+
+static inline void load_halves(const uint32_t *g, const uint32_t *c, __m256i *lo, __m256i *hi) {
+    *lo = _mm256_inserti128_si256(_mm256_castsi128_si256(_mm_loadu_si128((const __m128i *)g)),
+                                  _mm_loadu_si128((const __m128i *)c), 1);
+    *hi = _mm256_inserti128_si256(_mm256_castsi128_si256(_mm_loadu_si128((const __m128i *)(g + 4))),
+                                  _mm_loadu_si128((const __m128i *)(c + 4)), 1);
+}
+
+static inline void store_halves(uint32_t *g, uint32_t *c, __m256i lo, __m256i hi) {
+    _mm_storeu_si128((__m128i *)g, _mm256_castsi256_si128(lo));
+    _mm_storeu_si128((__m128i *)c, _mm256_extracti128_si256(lo, 1));
+    _mm_storeu_si128((__m128i *)(g + 4), _mm256_castsi256_si128(hi));
+    _mm_storeu_si128((__m128i *)(c + 4), _mm256_extracti128_si256(hi, 1));
+}
+
+void harmonia_xof_permute(uint32_t *state, int rounds) {
+    uint32_t *g = state;
+    uint32_t *c = state + 8;
+    __m256i lo, hi;
+    int r;
+
+    load_halves(g, c, &lo, &hi);
+
+    for (r = 0; r < rounds; r++) {
+        __m256i k = _mm256_inserti128_si256(_mm256_set1_epi32((int)PHI_CONSTANTS[r & 15]),
+                                            _mm_set1_epi32((int)RECIPROCAL_CONSTANTS[r & 15]), 1);
+        __m256i rot_a = load_rotations(r, 0);
+        __m256i rot_b = load_rotations(r + 1, 1);
+        __m256i va, vb;
+
+        if (FIBONACCI_WORD[r & 63]) {
+            /* mix_golden */
+            va = _mm256_xor_si256(_mm256_add_epi32(ROTRV(lo, rot_a), hi), k);
+            vb = _mm256_add_epi32(_mm256_xor_si256(ROTLV(hi, rot_b), va), k);
+
+            /* (va * 3) ^ (vb * 5) */
+            __m256i mix = _mm256_xor_si256(_mm256_add_epi32(_mm256_slli_epi32(va, 1), va),
+                                           _mm256_add_epi32(_mm256_slli_epi32(vb, 2), vb));
+            lo = _mm256_xor_si256(va, _mm256_srli_epi32(mix, 11));
+            hi = _mm256_xor_si256(vb, _mm256_slli_epi32(mix, 7));
+        } else {
+            /* mix_complementary */
+            __m256i k_half = _mm256_srli_epi32(k, 1);
+            lo = _mm256_add_epi32(ROTLV(_mm256_xor_si256(lo, hi), rot_a), k_half);
+            hi = _mm256_xor_si256(ROTRV(_mm256_add_epi32(hi, lo), rot_b), k_half);
+        }
+
+        if (r > 0 && (r & 3) == 0) {
+            store_halves(g, c, lo, hi);
+            diffuse(g, c, r);
+            load_halves(g, c, &lo, &hi);
+        }
+    }
+
+    store_halves(g, c, lo, hi);
+}
+
+#else
+
+void harmonia_xof_permute(uint32_t *state, int rounds) {
+    uint32_t *g = state;
+    uint32_t *c = state + 8;
+    int r, i;
+
+    for (r = 0; r < rounds; r++) {
+        uint32_t k_phi = PHI_CONSTANTS[r & 15];
+        uint32_t k_rec = RECIPROCAL_CONSTANTS[r & 15];
+
+        if (FIBONACCI_WORD[r & 63]) {
+            for (i = 0; i < 4; i++) {
+                mix_golden(&g[i], &g[i + 4], k_phi, r, i);
+                mix_golden(&c[i], &c[i + 4], k_rec, r, i + 4);
+            }
+        } else {
+            for (i = 0; i < 4; i++) {
+                mix_complementary(&g[i], &g[i + 4], k_phi, r, i);
+                mix_complementary(&c[i], &c[i + 4], k_rec, r, i + 4);
+            }
+        }
+
+        if (r > 0 && (r & 3) == 0) {
+            diffuse(g, c, r);
+        }
+    }
+}
+
+#endif /* __AVX2__ */
+
+void harmonia_xof_absorb(uint32_t *state, const uint8_t *data, size_t nblocks, int rounds) {
+    size_t b;
+    int i;
+
+    for (b = 0; b < nblocks; b++, data += 32) {
+        for (i = 0; i < 8; i++) {
+            state[i] ^= load_be32(data + 4 * i);
+        }
+        harmonia_xof_permute(state, rounds);
+    }
+}
+
+void harmonia_xof_squeeze(uint32_t *state, uint8_t *out, size_t nblocks, int rounds) {
+    size_t b;
+    int i;
+
+    for (b = 0; b < nblocks; b++, out += 32) {
+        if (b > 0) {
+            harmonia_xof_permute(state, rounds);
+        }
+        for (i = 0; i < 8; i++) {
+            store_be32(out + 4 * i, state[i]);
+        }
+    }
+}
@@ -17,16 +17,34 @@ Usage:
     xof = HarmoniaXOF()
     xof.absorb(b"message")
     output = xof.squeeze(1024)  # Get 1024 bytes
+
+If the C library built by `make python-xof-lib` is present, absorbing and
+squeezing run in native code through ctypes. Otherwise, if Numba is
+installed, the permutation runs as a compiled uint32 kernel; failing both,
+the pure-Python reference is used. All paths produce identical output.
 """
 
+import ctypes
+import os
 import struct
-from typing import List, Tuple
+from typing import Callable, Dict, List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the pure-Python permutation is always available
+    njit = prange = None
 
 # Import core HARMONIA functions
 from harmonia import (
     _rotr, _rotl, _quasicrystal_rotation, _penrose_index,
-    _mix_golden, _mix_complementary, _edge_protection,
-    PHI_CONSTANTS, RECIPROCAL_CONSTANTS, FIBONACCI_WORD, FIBONACCI
+    _mix_golden, _mix_complementary,
+    PHI_CONSTANTS, RECIPROCAL_CONSTANTS, FIBONACCI_WORD, FIBONACCI,
+    QUASICRYSTAL_ROTATIONS
 )
 
 VERSION = "1.0"
@@ -37,22 +55,44 @@ ROUNDS = 24      # Reduced rounds for XOF (still secure per analysis)
 
 MASK32 = 0xFFFFFFFF
 
+# One rate block as eight big-endian words
+_BLOCK_STRUCT = struct.Struct('>8I')
+
+# c word read by cross-stream diffusion for each g word, i.e. (i + 3) % 8
+_CROSS_IDX = tuple((i + 3) % 8 for i in range(8))
+
+# Per-round schedule, indexed directly by round number. Round r also reads
+# the rotations of round r + 1, which bounds the usable round count.
+_MAX_ROUNDS = len(QUASICRYSTAL_ROTATIONS) - 1
+_ROUND_A = tuple(FIBONACCI_WORD[r % 64] == 'A' for r in range(_MAX_ROUNDS))
+_KPHI = tuple(PHI_CONSTANTS[r % 16] for r in range(_MAX_ROUNDS))
+_KREC = tuple(RECIPROCAL_CONSTANTS[r % 16] for r in range(_MAX_ROUNDS))
+_CROSS_ROT = tuple(_quasicrystal_rotation(r, 4) for r in range(_MAX_ROUNDS))
+
+
+def _edge_protection_inplace(s: List[int], r: int) -> None:
+    """_edge_protection applied to an 8-word stream in place."""
+    fib_const = (FIBONACCI[r % 12] * 0x9E3779B9) & MASK32
+    left = _rotr(s[0], _quasicrystal_rotation(r, 0)) ^ fib_const
+    right = _rotl(s[7], _quasicrystal_rotation(r, 7)) ^ fib_const ^ MASK32
+
+    interaction = (left ^ right) >> 16
+    s[0] = (left + interaction) & MASK32
+    s[7] = (right + interaction) & MASK32
 
-def _permutation(state_g: List[int], state_c: List[int], rounds: int = ROUNDS) -> Tuple[List[int], List[int]]:
+
+def _permutation(g: List[int], c: List[int], rounds: int = ROUNDS) -> None:
     """
     HARMONIA permutation function for Sponge construction.
-    Processes the full 512-bit state without message injection.
+    Processes the full 512-bit state without message injection, updating
+    the two 8-word streams g and c in place.
     """
-    g = state_g[:]
-    c = state_c[:]
-
     for r in range(rounds):
-        round_type = FIBONACCI_WORD[r % 64]
-        k_phi = PHI_CONSTANTS[r % 16]
-        k_rec = RECIPROCAL_CONSTANTS[r % 16]
+        k_phi = _KPHI[r]
+        k_rec = _KREC[r]
 
         # Mix based on round type
-        if round_type == 'A':
+        if _ROUND_A[r]:
             for idx in range(4):
                 i = idx
                 j = (idx + 4) % 8
@@ -67,18 +107,317 @@ def _permutation(state_g: List[int], state_c: List[int], rounds: int = ROUNDS) -
 
         # Edge protection every 8 rounds
         if r > 0 and r % 8 == 0:
-            g = _edge_protection(g, r)
-            c = _edge_protection(c, r)
+            _edge_protection_inplace(g, r)
+            _edge_protection_inplace(c, r)
 
         # Cross-stream diffusion every 4 rounds
+        if r > 0 and r % 4 == 0:
+            # One pass over all 8 words with the rotations inlined. Words
+            # 5..7 read c[0..2] after they were updated, so the pass runs
+            # in word order rather than as independent whole-array ops.
+            rot = _CROSS_ROT[r]
+            inv = 32 - rot
+            for i, k in enumerate(_CROSS_IDX):
+                temp = g[i] ^ c[k]
+                g[i] = (g[i] + (((temp >> rot) | (temp << inv)) & MASK32)) & MASK32
+                c[i] ^= ((temp << rot) | (temp >> inv)) & MASK32
+
+
+# Straight-line permutations generated by _unrolled_permutation, by round count
+_UNROLLED: Dict[int, Callable[[List[int], List[int]], None]] = {}
+
+
+def _unrolled_permutation(rounds: int = ROUNDS) -> Callable[[List[int], List[int]], None]:
+    """
+    Return _permutation specialised to a fixed round count.
+
+    The round loop is unrolled into straight-line code on 16 local words:
+    round types, constants and rotation amounts become literals, and edge
+    protection and cross-stream diffusion appear only in the rounds where
+    they fire. The generated function is compiled once per round count.
+    """
+    fn = _UNROLLED.get(rounds)
+    if fn is not None:
+        return fn
+    if not 0 <= rounds <= _MAX_ROUNDS:
+        raise ValueError(f"rounds must be between 0 and {_MAX_ROUNDS}")
+
+    m = hex(MASK32)
+    lines = ['def permutation(g, c):',
+             '    g0, g1, g2, g3, g4, g5, g6, g7 = g',
+             '    c0, c1, c2, c3, c4, c5, c6, c7 = c']
+
+    for r in range(rounds):
+        for s, k, first in (('g', _KPHI[r], 0), ('c', _KREC[r], 4)):
+            for i in range(4):
+                a, b = f'{s}{i}', f'{s}{i + 4}'
+                rot1 = _quasicrystal_rotation(r, first + i)
+                rot2 = _quasicrystal_rotation(r + 1, first + i + 1)
+                if _ROUND_A[r]:
+                    lines += [
+                        f'    {a} = (((({a} >> {rot1}) | ({a} << {32 - rot1})) & {m}) + {b}) & {m} ^ {k:#x}',
+                        f'    {b} = (((({b} << {rot2}) | ({b} >> {32 - rot2})) & {m}) ^ {a}) + {k:#x} & {m}',
+                        f'    mix = ({a} * 3 ^ {b} * 5) & {m}',
+                        f'    {a} ^= mix >> 11',
+                        f'    {b} ^= (mix << 7) & {m}',
+                    ]
+                else:
+                    lines += [
+                        f'    t = {a} ^ {b}',
+                        f'    {a} = (((t << {rot1}) | (t >> {32 - rot1})) & {m}) + {k >> 1:#x} & {m}',
+                        f'    t = ({b} + {a}) & {m}',
+                        f'    {b} = ((t >> {rot2}) | (t << {32 - rot2})) & {m} ^ {k >> 1:#x}',
+                    ]
+
+        if r > 0 and r % 8 == 0:
+            fib_const = (FIBONACCI[r % 12] * 0x9E3779B9) & MASK32
+            rot_l = _quasicrystal_rotation(r, 0)
+            rot_r = _quasicrystal_rotation(r, 7)
+            for s in 'gc':
+                lines += [
+                    f'    t = (({s}0 >> {rot_l}) | ({s}0 << {32 - rot_l})) & {m} ^ {fib_const:#x}',
+                    f'    u = (({s}7 << {rot_r}) | ({s}7 >> {32 - rot_r})) & {m} ^ {fib_const ^ MASK32:#x}',
+                    f'    x = (t ^ u) >> 16',
+                    f'    {s}0 = (t + x) & {m}',
+                    f'    {s}7 = (u + x) & {m}',
+                ]
+
         if r > 0 and r % 4 == 0:
             rot = _quasicrystal_rotation(r, 4)
-            for i in range(8):
-                temp = (g[i] ^ c[(i + 3) % 8]) & MASK32
-                g[i] = (g[i] + _rotr(temp, rot)) & MASK32
-                c[i] = (c[i] ^ _rotl(temp, rot)) & MASK32
+            for i, k in enumerate(_CROSS_IDX):
+                lines += [
+                    f'    t = g{i} ^ c{k}',
+                    f'    g{i} = (g{i} + (((t >> {rot}) | (t << {32 - rot})) & {m})) & {m}',
+                    f'    c{i} ^= ((t << {rot}) | (t >> {32 - rot})) & {m}',
+                ]
+
+    lines += ['    g[:] = (g0, g1, g2, g3, g4, g5, g6, g7)',
+              '    c[:] = (c0, c1, c2, c3, c4, c5, c6, c7)']
+
+    namespace = {}
+    exec(compile('\n'.join(lines), f'<harmonia_xof permutation, {rounds} rounds>', 'exec'), namespace)
+    fn = _UNROLLED[rounds] = namespace['permutation']
+    return fn
+
+
+# ============================================================================
+# COMPILED BACKEND (optional, requires Numba)
+# ============================================================================
+#
+# Mirrors _permutation and the HARMONIA mixing primitives on uint32 values,
+# so additions wrap modulo 2^32 without masking; each result is narrowed
+# back to uint32 with np.uint32(). The state is updated in place.
+
+_HAVE_NUMBA = njit is not None
+
+if _HAVE_NUMBA:
+    _QROT_NP = np.array(QUASICRYSTAL_ROTATIONS, dtype=np.uint32)
+    _ROUND_A_NP = np.array(_ROUND_A, dtype=np.int8)
+    _KPHI_NP = np.array(_KPHI, dtype=np.uint32)
+    _KREC_NP = np.array(_KREC, dtype=np.uint32)
+    _EDGE_FIB_NP = np.array([(FIBONACCI[r % 12] * 0x9E3779B9) & MASK32
+                             for r in range(len(QUASICRYSTAL_ROTATIONS))], dtype=np.uint32)
+
+    @njit(inline='always')
+    def _rotr_nb(x, n):
+        return np.uint32((x >> n) | (x << (32 - n)))
+
+    @njit(inline='always')
+    def _rotl_nb(x, n):
+        return np.uint32((x << n) | (x >> (32 - n)))
+
+    @njit(inline='always')
+    def _mix_golden_nb(a, b, k, r, i):
+        a = _rotr_nb(a, _QROT_NP[r, i])
+        a = np.uint32(np.uint32(a + b) ^ k)
+
+        b = _rotl_nb(b, _QROT_NP[r + 1, i + 1])
+        b = np.uint32((b ^ a) + k)
+
+        mix = np.uint32((a * np.uint32(3)) ^ (b * np.uint32(5)))
+        a = np.uint32(a ^ (mix >> 11))
+        b = np.uint32(b ^ (mix << 7))
+        return a, b
+
+    @njit(inline='always')
+    def _mix_complementary_nb(a, b, k, r, i):
+        a = _rotl_nb(np.uint32(a ^ b), _QROT_NP[r, i])
+        a = np.uint32(a + (k >> 1))
+
+        b = np.uint32(b + a)
+        b = np.uint32(_rotr_nb(b, _QROT_NP[r + 1, i + 1]) ^ (k >> 1))
+        return a, b
+
+    @njit(inline='always')
+    def _edge_protection_nb(s, r):
+        """Edge protection on an 8-word stream, in place."""
+        fib_const = _EDGE_FIB_NP[r]
+        left = np.uint32(_rotr_nb(s[0], _QROT_NP[r, 0]) ^ fib_const)
+        right = np.uint32(_rotl_nb(s[7], _QROT_NP[r, 7]) ^ ~fib_const)
+
+        interaction = np.uint32((left ^ right) >> 16)
+        s[0] = left + interaction
+        s[7] = right + interaction
+
+    @njit('void(uint32[::1], uint32[::1], int64)', cache=True, boundscheck=False)
+    def _permutation_nb(g, c, rounds):
+        """Apply `rounds` rounds of the permutation to uint32[8] g and c in place."""
+        # The round tables are read without bounds checks
+        if rounds < 0 or rounds > _MAX_ROUNDS:
+            raise ValueError("rounds out of range for the round tables")
+
+        for r in range(rounds):
+            k_phi = _KPHI_NP[r]
+            k_rec = _KREC_NP[r]
+
+            if _ROUND_A_NP[r]:
+                for i in range(4):
+                    g[i], g[i + 4] = _mix_golden_nb(g[i], g[i + 4], k_phi, r, i)
+                    c[i], c[i + 4] = _mix_golden_nb(c[i], c[i + 4], k_rec, r, i + 4)
+            else:
+                for i in range(4):
+                    g[i], g[i + 4] = _mix_complementary_nb(g[i], g[i + 4], k_phi, r, i)
+                    c[i], c[i + 4] = _mix_complementary_nb(c[i], c[i + 4], k_rec, r, i + 4)
+
+            if r > 0 and r % 8 == 0:
+                _edge_protection_nb(g, r)
+                _edge_protection_nb(c, r)
+
+            if r > 0 and r % 4 == 0:
+                rot = _QROT_NP[r, 4]
+                for i in range(8):
+                    temp = g[i] ^ c[(i + 3) % 8]
+                    g[i] = g[i] + _rotr_nb(temp, rot)
+                    c[i] = c[i] ^ _rotl_nb(temp, rot)
+
+    @njit(cache=True, boundscheck=False)
+    def _squeeze_nb(g, c, out, rounds):
+        """
+        Squeeze out.shape[0] rate blocks: row b of out receives g, with a
+        permutation between consecutive blocks (none after the last).
+        """
+        for b in range(out.shape[0]):
+            if b > 0:
+                _permutation_nb(g, c, rounds)
+            out[b] = g
 
-    return g, c
+    @njit(cache=True, parallel=True)
+    def _xof_batch_nb(words, offsets, out, rounds):
+        """
+        Run independent sponges in parallel, one per thread.
+
+        Message m's padded words are words[offsets[m]:offsets[m + 1]];
+        its squeezed rate blocks are written to out[m].
+        """
+        for m in prange(out.shape[0]):
+            g = np.zeros(8, dtype=np.uint32)
+            c = np.zeros(8, dtype=np.uint32)
+            for off in range(offsets[m], offsets[m + 1], 8):
+                for i in range(8):
+                    g[i] ^= words[off + i]
+                _permutation_nb(g, c, rounds)
+            _squeeze_nb(g, c, out[m], rounds)
+
+
+# ============================================================================
+# NATIVE LIBRARY (optional, built with `make python-xof-lib`)
+# ============================================================================
+
+_LIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libharmonia_xof.so')
+
+try:
+    _lib = ctypes.CDLL(_LIB_PATH)
+except OSError:
+    _lib = None
+
+_STATE_T = ctypes.c_uint32 * 16
+
+if _lib is not None:
+    _lib.harmonia_xof_permute.argtypes = (_STATE_T, ctypes.c_int)
+    _lib.harmonia_xof_absorb.argtypes = (_STATE_T, ctypes.c_char_p, ctypes.c_size_t, ctypes.c_int)
+    _lib.harmonia_xof_squeeze.argtypes = (_STATE_T, ctypes.c_char_p, ctypes.c_size_t, ctypes.c_int)
+    for _fn in (_lib.harmonia_xof_permute, _lib.harmonia_xof_absorb, _lib.harmonia_xof_squeeze):
+        _fn.restype = None
+
+
+# ============================================================================
+# SPONGE STATE
+# ============================================================================
+#
+# The state is the rate stream g followed by the capacity stream c, held as
+# a ctypes uint32[16] for the C library, a (2, 8) uint32 array (one
+# contiguous 64-byte buffer whose rows are g and c) for the Numba kernels,
+# or a [g, c] pair of lists for the pure-Python permutation.
+
+def _new_state():
+    """Return an all-zero state for the active backend."""
+    if _lib is not None:
+        return _STATE_T()
+    if _HAVE_NUMBA:
+        return np.zeros((2, 8), dtype=np.uint32)
+    return [[0] * 8, [0] * 8]
+
+
+def _copy_state(state):
+    """Return an independent copy of a state."""
+    if _lib is not None:
+        return _STATE_T.from_buffer_copy(state)
+    if _HAVE_NUMBA:
+        return state.copy()
+    return [state[0][:], state[1][:]]
+
+
+def _absorb_blocks(state, data: bytes, nblocks: int) -> None:
+    """XOR each of the nblocks RATE-byte blocks of data into g and permute."""
+    if _lib is not None:
+        _lib.harmonia_xof_absorb(state, data, nblocks, ROUNDS)
+        return
+
+    for off in range(0, nblocks * RATE, RATE):
+        if _HAVE_NUMBA:
+            g, c = state
+            g ^= np.frombuffer(data, dtype='>u4', count=8, offset=off)
+            _permutation_nb(g, c, ROUNDS)
+        else:
+            g = state[0]
+            w0, w1, w2, w3, w4, w5, w6, w7 = _BLOCK_STRUCT.unpack_from(data, off)
+            g[:] = (g[0] ^ w0, g[1] ^ w1, g[2] ^ w2, g[3] ^ w3,
+                    g[4] ^ w4, g[5] ^ w5, g[6] ^ w6, g[7] ^ w7)
+            _unrolled_permutation()(g, state[1])
+
+
+def _squeeze_blocks(state, nblocks: int) -> bytes:
+    """
+    Emit nblocks rate blocks, permuting between consecutive blocks; the
+    state is left at the last block emitted.
+    """
+    if _lib is not None:
+        out = ctypes.create_string_buffer(nblocks * RATE)
+        _lib.harmonia_xof_squeeze(state, out, nblocks, ROUNDS)
+        return out.raw
+
+    if _HAVE_NUMBA:
+        out = np.empty((nblocks, 8), dtype=np.uint32)
+        _squeeze_nb(state[0], state[1], out, ROUNDS)
+        return out.astype('>u4').tobytes()
+
+    blocks = []
+    for b in range(nblocks):
+        if b > 0:
+            _unrolled_permutation()(state[0], state[1])
+        blocks.append(_BLOCK_STRUCT.pack(*state[0]))
+    return b''.join(blocks)
+
+
+def _xof_padding(tail_len: int) -> bytes:
+    """
+    Padding that completes a final block holding tail_len (< RATE) bytes:
+    0x1F domain separator, zeros, then 0x80 (both in one byte if only one fits).
+    """
+    pad = bytearray(RATE - tail_len)
+    pad[0] = 0x1F
+    pad[-1] |= 0x80  # Same byte as pad[0] when only one fits: 0x9F
+    return bytes(pad)
 
 
 class HarmoniaXOF:
@@ -91,21 +430,16 @@ class HarmoniaXOF:
 
     def __init__(self):
         """Initialize XOF with zero state."""
-        self._state_g = [0] * 8  # 256 bits
-        self._state_c = [0] * 8  # 256 bits (capacity)
+        self._state = _new_state()  # 256-bit rate g + 256-bit capacity c
         self._buffer = bytearray()
         self._absorbing = True
-        self._squeeze_buffer = bytearray()
+        self._squeeze_buffer = b''  # Excess of the last squeezed blocks
+        self._squeeze_pos = 0       # Bytes of _squeeze_buffer already returned
 
     def _absorb_block(self, block: bytes):
         """Absorb a RATE-sized block into the state."""
-        # XOR block into rate portion (state_g)
-        words = struct.unpack('>8I', block)
-        for i in range(8):
-            self._state_g[i] ^= words[i]
-
-        # Apply permutation
-        self._state_g, self._state_c = _permutation(self._state_g, self._state_c)
+        # XOR block into rate portion (state_g) and apply permutation
+        _absorb_blocks(self._state, block, 1)
 
     def absorb(self, data: bytes) -> 'HarmoniaXOF':
         """
@@ -120,12 +454,23 @@ class HarmoniaXOF:
         if not self._absorbing:
             raise RuntimeError("Cannot absorb after squeezing has started")
 
-        self._buffer.extend(data)
-
-        # Process complete blocks
-        while len(self._buffer) >= RATE:
-            self._absorb_block(bytes(self._buffer[:RATE]))
-            del self._buffer[:RATE]
+        # Top up a partial block left by the previous call
+        start = 0
+        if self._buffer:
+            start = min(RATE - len(self._buffer), len(data))
+            self._buffer.extend(data[:start])
+            if len(self._buffer) < RATE:
+                return self
+            self._absorb_block(bytes(self._buffer))
+            self._buffer.clear()
+
+        # Absorb complete blocks straight from data in one backend call,
+        # buffering only the tail
+        nblocks = (len(data) - start) // RATE
+        end = start + nblocks * RATE
+        if nblocks:
+            _absorb_blocks(self._state, bytes(data[start:end]), nblocks)
+        self._buffer.extend(data[end:])
 
         return self
 
@@ -136,13 +481,7 @@ class HarmoniaXOF:
 
         # Pad: append 0x1F, then zeros, then 0x80
         # (Sponge domain separation + padding)
-        pad_len = RATE - len(self._buffer)
-        if pad_len == 1:
-            self._buffer.append(0x9F)  # 0x1F | 0x80
-        else:
-            self._buffer.append(0x1F)  # Domain separator for XOF
-            self._buffer.extend(b'\x00' * (pad_len - 2))
-            self._buffer.append(0x80)
+        self._buffer.extend(_xof_padding(len(self._buffer)))
 
         self._absorb_block(bytes(self._buffer))
         self._buffer.clear()
@@ -160,33 +499,24 @@ class HarmoniaXOF:
         """
         self._finalize_absorb()
 
-        output = bytearray()
+        output = []
 
         # Use any remaining squeeze buffer
-        if self._squeeze_buffer:
-            take = min(len(self._squeeze_buffer), length)
-            output.extend(self._squeeze_buffer[:take])
-            del self._squeeze_buffer[:take]
+        pos = self._squeeze_pos
+        if pos < len(self._squeeze_buffer):
+            take = min(len(self._squeeze_buffer) - pos, length)
+            output.append(self._squeeze_buffer[pos:pos + take])
+            self._squeeze_pos = pos + take
             length -= take
 
-        # Squeeze more blocks as needed
-        while length > 0:
-            # Extract rate portion
-            block = struct.pack('>8I', *self._state_g)
-
-            take = min(len(block), length)
-            output.extend(block[:take])
-            length -= take
+        # Squeeze more blocks as needed, saving the excess for the next call
+        if length > 0:
+            blocks = _squeeze_blocks(self._state, (length + RATE - 1) // RATE)
+            output.append(blocks[:length])
+            self._squeeze_buffer = blocks
+            self._squeeze_pos = length
 
-            # Save excess for next squeeze
-            if take < len(block):
-                self._squeeze_buffer.extend(block[take:])
-
-            # Apply permutation for next block
-            if length > 0:
-                self._state_g, self._state_c = _permutation(self._state_g, self._state_c)
-
-        return bytes(output)
+        return b''.join(output)
 
     def hexdigest(self, length: int) -> str:
         """Squeeze and return hex string."""
@@ -195,11 +525,11 @@ class HarmoniaXOF:
     def copy(self) -> 'HarmoniaXOF':
         """Create a copy of current state."""
         new = HarmoniaXOF()
-        new._state_g = self._state_g[:]
-        new._state_c = self._state_c[:]
+        new._state = _copy_state(self._state)
         new._buffer = self._buffer[:]
         new._absorbing = self._absorbing
-        new._squeeze_buffer = self._squeeze_buffer[:]
+        new._squeeze_buffer = self._squeeze_buffer
+        new._squeeze_pos = self._squeeze_pos
         return new
 
 
@@ -221,6 +551,38 @@ def harmonia_xof(data: bytes, output_length: int = 32) -> bytes:
     return xof.squeeze(output_length)
 
 
+def harmonia_xof_batch(messages: List[bytes], output_length: int = 32) -> List[bytes]:
+    """
+    Compute HARMONIA-XOF outputs for many independent messages.
+
+    A single sponge is inherently serial (each output block is the
+    permutation of the previous one), but separate messages are not: with
+    Numba all of them are absorbed and squeezed in one call to a
+    multithreaded kernel. Without Numba this is equivalent to
+    [harmonia_xof(m, output_length) for m in messages].
+
+    Args:
+        messages: Input byte strings
+        output_length: Output length in bytes for every message
+
+    Returns:
+        List of outputs, in the same order
+    """
+    if _lib is not None or not _HAVE_NUMBA:
+        return [harmonia_xof(message, output_length) for message in messages]
+
+    padded = [message + _xof_padding(len(message) % RATE) for message in messages]
+
+    offsets = np.zeros(len(padded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(p) // 4 for p in padded])
+    words = np.frombuffer(b''.join(padded), dtype='>u4').astype(np.uint32)
+    out = np.empty((len(padded), (output_length + RATE - 1) // RATE, 8), dtype=np.uint32)
+    _xof_batch_nb(words, offsets, out, ROUNDS)
+
+    out = out.astype('>u4')
+    return [out[m].tobytes()[:output_length] for m in range(len(padded))]
+
+
 def harmonia_xof_hex(data: bytes, output_length: int = 32) -> str:
     """Compute HARMONIA-XOF and return hex string."""
     return harmonia_xof(data, output_length).hex()
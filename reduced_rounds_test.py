@@ -9,45 +9,73 @@ to determine minimum secure round count.
 import random
 import math
 import struct
+from typing import List
+
+import numpy as np
+
 from harmonia import (
-    _rotr, _rotl, _quasicrystal_rotation, _penrose_index,
+    _rotr, _quasicrystal_rotation, _penrose_index,
     _mix_golden, _mix_complementary, _edge_protection,
     _pad_message, _finalize, _init_state,
-    PHI_CONSTANTS, RECIPROCAL_CONSTANTS, FIBONACCI_WORD, FIBONACCI
+    PHI_CONSTANTS, RECIPROCAL_CONSTANTS, FIBONACCI_WORD, FIBONACCI,
+    NUM_ROUNDS, QUASICRYSTAL_ROTATIONS
 )
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; harmonia_reduced_batch falls back to harmonia_reduced
+    njit = None
+
 # Initial states are first 8 constants
 INITIAL_STATE_G = PHI_CONSTANTS[:8]
 INITIAL_STATE_C = RECIPROCAL_CONSTANTS[:8]
 
+# Per-round schedule, indexed directly by round number. Round r also reads
+# the rotations of round r + 1, which bounds the usable round count.
+_MAX_ROUNDS = len(QUASICRYSTAL_ROTATIONS) - 1
+_ROUND_A = tuple(FIBONACCI_WORD[r % 64] == 'A' for r in range(_MAX_ROUNDS))
+_KPHI = tuple(PHI_CONSTANTS[r % 16] for r in range(_MAX_ROUNDS))
+_KREC = tuple(RECIPROCAL_CONSTANTS[r % 16] for r in range(_MAX_ROUNDS))
+_CROSS_ROT = tuple(_quasicrystal_rotation(r, 4) for r in range(_MAX_ROUNDS))
+
+# Message expansion rotations and Penrose indices, by word index
+_MSG_ROT1 = tuple(_quasicrystal_rotation(i, 0) for i in range(64))
+_MSG_ROT2 = tuple(_quasicrystal_rotation(i, 1) for i in range(64))
+_PEN_IDX = tuple(_penrose_index(i) for i in range(64))
+
 
 def _expand_message_reduced(block: bytes) -> list:
     """Expand 64-byte block to 64 words."""
     w = list(struct.unpack('>16I', block))
 
     for i in range(16, 64):
-        rot1 = _quasicrystal_rotation(i, 0)
-        rot2 = _quasicrystal_rotation(i, 1)
+        rot1 = _MSG_ROT1[i]
+        rot2 = _MSG_ROT2[i]
 
         s0 = _rotr(w[i-15], rot1) ^ _rotr(w[i-15], rot1 + 5) ^ (w[i-15] >> 3)
         s1 = _rotr(w[i-2], rot2) ^ _rotr(w[i-2], rot2 + 7) ^ (w[i-2] >> 10)
 
-        fib_idx = _penrose_index(i)
-        fib_factor = FIBONACCI[fib_idx % 12]
+        fib_factor = FIBONACCI[_PEN_IDX[i] % 12]
 
         w.append((w[i-16] + s0 + w[i-7] + s1 + fib_factor) & 0xFFFFFFFF)
 
     return w
 
 
+# c word read for each g word in cross-stream diffusion, i.e. (i + 3) % 8
+_CROSS_IDX = tuple((i + 3) % 8 for i in range(8))
+
+
 def _cross_stream_diffusion_reduced(g: list, c: list, r: int) -> tuple:
     """Cross-stream diffusion."""
-    rot = _quasicrystal_rotation(r, 4)
+    rot = _CROSS_ROT[r]
+    inv = 32 - rot
 
-    for i in range(8):
-        temp = (g[i] ^ c[(i + 3) % 8]) & 0xFFFFFFFF
-        g[i] = (g[i] + _rotr(temp, rot)) & 0xFFFFFFFF
-        c[i] = (c[i] ^ _rotl(temp, rot)) & 0xFFFFFFFF
+    # In word order: words 5..7 read c[0..2] after their update
+    for i, k in enumerate(_CROSS_IDX):
+        temp = g[i] ^ c[k]
+        g[i] = (g[i] + (((temp >> rot) | (temp << inv)) & 0xFFFFFFFF)) & 0xFFFFFFFF
+        c[i] ^= ((temp << rot) | (temp >> inv)) & 0xFFFFFFFF
 
     return g, c
 
@@ -60,11 +88,10 @@ def compress_reduced(block: bytes, state_g: list, state_c: list, num_rounds: int
     c = state_c[:]
 
     for r in range(num_rounds):
-        round_type = FIBONACCI_WORD[r % 64]
-        k_phi = PHI_CONSTANTS[r % 16]
-        k_rec = RECIPROCAL_CONSTANTS[r % 16]
+        k_phi = _KPHI[r]
+        k_rec = _KREC[r]
 
-        if round_type == 'A':
+        if _ROUND_A[r]:
             for idx in range(4):
                 i = idx
                 j = (idx + 4) % 8
@@ -103,43 +130,260 @@ def harmonia_reduced(data: bytes, num_rounds: int) -> bytes:
     return _finalize(state_g, state_c)
 
 
-def hamming_distance(a: bytes, b: bytes) -> int:
-    """Count differing bits."""
-    return sum(bin(x ^ y).count('1') for x, y in zip(a, b))
-
-
-def flip_bit(data: bytes, bit_pos: int) -> bytes:
-    """Flip a single bit."""
-    data = bytearray(data)
-    byte_idx = bit_pos // 8
-    bit_idx = 7 - (bit_pos % 8)
-    data[byte_idx] ^= (1 << bit_idx)
-    return bytes(data)
-
-
-def bytes_to_bits(data: bytes) -> list:
-    """Convert bytes to bit list."""
-    bits = []
-    for byte in data:
-        for i in range(7, -1, -1):
-            bits.append((byte >> i) & 1)
-    return bits
+# ============================================================================
+# BATCHED HASHING (optional, requires Numba)
+# ============================================================================
+#
+# compress_reduced, the message expansion and _finalize on uint32 values,
+# so additions wrap modulo 2^32 without masking; each result is narrowed
+# back to uint32 with np.uint32().
+
+_HAVE_NUMBA = njit is not None
+
+if _HAVE_NUMBA:
+    _QROT_NP = np.array(QUASICRYSTAL_ROTATIONS, dtype=np.uint32)
+    _EDGE_FIB_NP = np.array([(FIBONACCI[r % 12] * 0x9E3779B9) & 0xFFFFFFFF
+                             for r in range(len(QUASICRYSTAL_ROTATIONS))], dtype=np.uint32)
+    _INITIAL_STATE_NP = np.array(INITIAL_STATE_G + INITIAL_STATE_C, dtype=np.uint32)
+    _ROUND_A_NP = np.array(_ROUND_A, dtype=np.int8)
+    _KPHI_NP = np.array(_KPHI, dtype=np.uint32)
+    _KREC_NP = np.array(_KREC, dtype=np.uint32)
+    _CROSS_ROT_NP = np.array(_CROSS_ROT, dtype=np.uint32)
+    _MSG_ROT1_NP = np.array(_MSG_ROT1, dtype=np.uint32)
+    _MSG_ROT2_NP = np.array(_MSG_ROT2, dtype=np.uint32)
+    _MSG_FIB_NP = np.array([FIBONACCI[p % 12] for p in _PEN_IDX], dtype=np.uint32)
+    _FUSE_ADD_NP = np.array([(PHI_CONSTANTS[i] + _penrose_index(i) * 0x01010101) & 0xFFFFFFFF
+                             for i in range(8)], dtype=np.uint32)
+
+    @njit(inline='always')
+    def _rotr_nb(x, n):
+        return np.uint32((x >> n) | (x << (32 - n)))
+
+    @njit(inline='always')
+    def _rotl_nb(x, n):
+        return np.uint32((x << n) | (x >> (32 - n)))
+
+    @njit(inline='always')
+    def _mix_golden_nb(a, b, k, r, i):
+        """_mix_golden on uint32 words."""
+        a = _rotr_nb(a, _QROT_NP[r, i])
+        a = np.uint32(np.uint32(a + b) ^ k)
+
+        b = _rotl_nb(b, _QROT_NP[r + 1, i + 1])
+        b = np.uint32((b ^ a) + k)
+
+        mix = np.uint32((a * np.uint32(3)) ^ (b * np.uint32(5)))
+        a = np.uint32(a ^ (mix >> 11))
+        b = np.uint32(b ^ (mix << 7))
+        return a, b
+
+    @njit(inline='always')
+    def _mix_complementary_nb(a, b, k, r, i):
+        """_mix_complementary on uint32 words."""
+        a = _rotl_nb(np.uint32(a ^ b), _QROT_NP[r, i])
+        a = np.uint32(a + (k >> 1))
+
+        b = np.uint32(b + a)
+        b = np.uint32(_rotr_nb(b, _QROT_NP[r + 1, i + 1]) ^ (k >> 1))
+        return a, b
+
+    @njit(inline='always')
+    def _expand_message_nb(block, w):
+        """_expand_message_reduced of 16 message words into uint32[64] w."""
+        for i in range(16):
+            w[i] = block[i]
+
+        for i in range(16, 64):
+            x = w[i - 15]
+            y = w[i - 2]
+            rot1 = _MSG_ROT1_NP[i]
+            rot2 = _MSG_ROT2_NP[i]
+            s0 = np.uint32(_rotr_nb(x, rot1) ^ _rotr_nb(x, rot1 + np.uint32(5)) ^ (x >> 3))
+            s1 = np.uint32(_rotr_nb(y, rot2) ^ _rotr_nb(y, rot2 + np.uint32(7)) ^ (y >> 10))
+            w[i] = w[i - 16] + s0 + w[i - 7] + s1 + _MSG_FIB_NP[i]
+
+    @njit(inline='always')
+    def _edge_words_nb(s0, s7, r):
+        """Edge protection of the first and last words of an 8-word stream."""
+        fib_const = _EDGE_FIB_NP[r]
+        left = np.uint32(_rotr_nb(s0, _QROT_NP[r, 0]) ^ fib_const)
+        right = np.uint32(_rotl_nb(s7, _QROT_NP[r, 7]) ^ ~fib_const)
+
+        interaction = np.uint32((left ^ right) >> 16)
+        return np.uint32(left + interaction), np.uint32(right + interaction)
+
+    @njit(inline='always')
+    def _cross_word_nb(gi, ci, ck, rot):
+        """Cross-stream diffusion of word i, reading c word k = (i + 3) % 8."""
+        temp = np.uint32(gi ^ ck)
+        return np.uint32(gi + _rotr_nb(temp, rot)), np.uint32(ci ^ _rotl_nb(temp, rot))
+
+    @njit(cache=True, boundscheck=False)
+    def _compress_reduced_nb(block, w, state, num_rounds):
+        """
+        compress_reduced on 16 message words; state (g || c) is updated in
+        place, with w as the message schedule buffer.
+
+        The 16 state words live in scalar locals across all rounds and are
+        only written back for the final feed-forward.
+        """
+        _expand_message_nb(block, w)
+
+        g0, g1, g2, g3 = state[0], state[1], state[2], state[3]
+        g4, g5, g6, g7 = state[4], state[5], state[6], state[7]
+        c0, c1, c2, c3 = state[8], state[9], state[10], state[11]
+        c4, c5, c6, c7 = state[12], state[13], state[14], state[15]
+
+        for r in range(num_rounds):
+            k_phi = np.uint32(_KPHI_NP[r] ^ w[r % 64])
+            k_rec = np.uint32(_KREC_NP[r] ^ w[(r + 1) % 64])
+
+            if _ROUND_A_NP[r]:
+                g0, g4 = _mix_golden_nb(g0, g4, k_phi, r, 0)
+                g1, g5 = _mix_golden_nb(g1, g5, k_phi, r, 1)
+                g2, g6 = _mix_golden_nb(g2, g6, k_phi, r, 2)
+                g3, g7 = _mix_golden_nb(g3, g7, k_phi, r, 3)
+                c0, c4 = _mix_golden_nb(c0, c4, k_rec, r, 4)
+                c1, c5 = _mix_golden_nb(c1, c5, k_rec, r, 5)
+                c2, c6 = _mix_golden_nb(c2, c6, k_rec, r, 6)
+                c3, c7 = _mix_golden_nb(c3, c7, k_rec, r, 7)
+            else:
+                g0, g4 = _mix_complementary_nb(g0, g4, k_phi, r, 0)
+                g1, g5 = _mix_complementary_nb(g1, g5, k_phi, r, 1)
+                g2, g6 = _mix_complementary_nb(g2, g6, k_phi, r, 2)
+                g3, g7 = _mix_complementary_nb(g3, g7, k_phi, r, 3)
+                c0, c4 = _mix_complementary_nb(c0, c4, k_rec, r, 4)
+                c1, c5 = _mix_complementary_nb(c1, c5, k_rec, r, 5)
+                c2, c6 = _mix_complementary_nb(c2, c6, k_rec, r, 6)
+                c3, c7 = _mix_complementary_nb(c3, c7, k_rec, r, 7)
+
+            if r > 0 and r % 8 == 0:
+                g0, g7 = _edge_words_nb(g0, g7, r)
+                c0, c7 = _edge_words_nb(c0, c7, r)
+
+            if r > 0 and r % 4 == 0:
+                # In word order: words 5..7 read c0..c2 after their update
+                rot = _CROSS_ROT_NP[r]
+                g0, c0 = _cross_word_nb(g0, c0, c3, rot)
+                g1, c1 = _cross_word_nb(g1, c1, c4, rot)
+                g2, c2 = _cross_word_nb(g2, c2, c5, rot)
+                g3, c3 = _cross_word_nb(g3, c3, c6, rot)
+                g4, c4 = _cross_word_nb(g4, c4, c7, rot)
+                g5, c5 = _cross_word_nb(g5, c5, c0, rot)
+                g6, c6 = _cross_word_nb(g6, c6, c1, rot)
+                g7, c7 = _cross_word_nb(g7, c7, c2, rot)
+
+        state[0] += g0
+        state[1] += g1
+        state[2] += g2
+        state[3] += g3
+        state[4] += g4
+        state[5] += g5
+        state[6] += g6
+        state[7] += g7
+        state[8] += c0
+        state[9] += c1
+        state[10] += c2
+        state[11] += c3
+        state[12] += c4
+        state[13] += c5
+        state[14] += c6
+        state[15] += c7
+
+    @njit(cache=True, boundscheck=False)
+    def _finalize_reduced_nb(state, out):
+        """_finalize of state (g || c) into 8 digest words."""
+        g = state[:8].copy()
+        c = state[8:].copy()
+        g[0], g[7] = _edge_words_nb(g[0], g[7], NUM_ROUNDS)
+        c[0], c[7] = _edge_words_nb(c[0], c[7], NUM_ROUNDS + 1)
+
+        for i in range(8):
+            rot = _QROT_NP[i, i]
+            out[i] = (_rotr_nb(g[i], rot) ^ _rotl_nb(c[i], rot)) + _FUSE_ADD_NP[i]
+
+    @njit(cache=True, parallel=True)
+    def _reduced_batch_nb(words, offsets, out, num_rounds):
+        """
+        Hash independent messages in parallel, one per thread.
+
+        Message m's padded words are words[offsets[m]:offsets[m + 1]];
+        its digest words are written to out[m].
+        """
+        for m in prange(out.shape[0]):
+            w = np.empty(64, dtype=np.uint32)
+            state = _INITIAL_STATE_NP.copy()
+            for off in range(offsets[m], offsets[m + 1], 16):
+                _compress_reduced_nb(words[off:off + 16], w, state, num_rounds)
+            _finalize_reduced_nb(state, out[m])
+
+
+def harmonia_reduced_batch(messages: List[bytes], num_rounds: int) -> List[bytes]:
+    """
+    Hash many messages with reduced rounds.
+
+    With Numba all messages are padded up front and hashed in one call to
+    a multithreaded kernel. Without Numba this is equivalent to
+    [harmonia_reduced(m, num_rounds) for m in messages].
+
+    Raises:
+        ValueError: If num_rounds is outside 0.._MAX_ROUNDS
+    """
+    if not 0 <= num_rounds <= _MAX_ROUNDS:
+        raise ValueError(f"num_rounds must be between 0 and {_MAX_ROUNDS}")
+
+    if not _HAVE_NUMBA:
+        return [harmonia_reduced(message, num_rounds) for message in messages]
+
+    padded = [_pad_message(message) for message in messages]
+
+    offsets = np.zeros(len(padded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(p) // 4 for p in padded])
+    words = np.frombuffer(b''.join(padded), dtype='>u4').astype(np.uint32)
+    out = np.empty((len(padded), 8), dtype=np.uint32)
+    _reduced_batch_nb(words, offsets, out, num_rounds)
+
+    out = out.astype('>u4')
+    return [out[m].tobytes() for m in range(len(padded))]
+
+
+if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+    _popcount8 = np.bitwise_count
+else:
+    # Popcount of every byte value
+    _POPCNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+    def _popcount8(x: np.ndarray) -> np.ndarray:
+        """Per-element popcount of a uint8 array."""
+        return _POPCNT8[x]
+
+
+def bytes_to_bits(data: bytes) -> np.ndarray:
+    """Convert bytes to an array of bits, most significant bit first."""
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
 
 
 def test_avalanche_reduced(num_rounds: int, samples: int = 300) -> dict:
     """Test avalanche effect with reduced rounds."""
-    bit_changes = []
-
-    for _ in range(samples):
-        msg = random.randbytes(random.randint(8, 64))
-        original_hash = harmonia_reduced(msg, num_rounds)
-
-        bit_pos = random.randint(0, len(msg) * 8 - 1)
-        modified_msg = flip_bit(msg, bit_pos)
-        modified_hash = harmonia_reduced(modified_msg, num_rounds)
-
-        changed = hamming_distance(original_hash, modified_hash)
-        bit_changes.append(changed)
+    # Draw all messages (8-64 bytes) and the bit to flip in each up front
+    rng = np.random.default_rng()
+    lengths = rng.integers(8, 65, size=samples)
+    offsets = np.zeros(samples + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(lengths)
+    data = rng.bytes(int(offsets[-1]))
+
+    flipped = np.frombuffer(data, dtype=np.uint8).copy()
+    bit_pos = offsets[:-1] * 8 + rng.integers(0, lengths * 8)
+    flipped[bit_pos // 8] ^= (0x80 >> (bit_pos % 8)).astype(np.uint8)
+    flipped = flipped.tobytes()
+
+    messages = [data[offsets[m]:offsets[m + 1]] for m in range(samples)]
+    modified = [flipped[offsets[m]:offsets[m + 1]] for m in range(samples)]
+
+    original_hashes = np.frombuffer(b''.join(harmonia_reduced_batch(messages, num_rounds)), dtype=np.uint8)
+    modified_hashes = np.frombuffer(b''.join(harmonia_reduced_batch(modified, num_rounds)), dtype=np.uint8)
+    diff = (original_hashes ^ modified_hashes).reshape(samples, -1)
+    bit_changes = _popcount8(diff).sum(axis=1, dtype=np.int64).tolist()
 
     avg_change = sum(bit_changes) / len(bit_changes)
     pct_change = avg_change / 256 * 100
@@ -158,15 +402,10 @@ def test_avalanche_reduced(num_rounds: int, samples: int = 300) -> dict:
 
 def test_bit_distribution_reduced(num_rounds: int, samples: int = 500) -> dict:
     """Test bit distribution with reduced rounds."""
-    total_ones = 0
-    total_bits = 0
-
-    for i in range(samples):
-        msg = i.to_bytes((i.bit_length() + 7) // 8 or 1, 'big')
-        h = harmonia_reduced(msg, num_rounds)
-        bits = bytes_to_bits(h)
-        total_ones += sum(bits)
-        total_bits += len(bits)
+    messages = [i.to_bytes((i.bit_length() + 7) // 8 or 1, 'big') for i in range(samples)]
+    bits = bytes_to_bits(b''.join(harmonia_reduced_batch(messages, num_rounds)))
+    total_ones = int(bits.sum(dtype=np.int64))
+    total_bits = bits.size
 
     pct_ones = total_ones / total_bits * 100
     deviation = abs(50 - pct_ones)
@@ -179,11 +418,30 @@ def test_bit_distribution_reduced(num_rounds: int, samples: int = 500) -> dict:
     }
 
 
+def test_batch_consistency(samples: int = 50) -> bool:
+    """Check harmonia_reduced_batch against harmonia_reduced, including the boundary round counts."""
+    rng = random.Random(0)
+    messages = [rng.randbytes(rng.randint(0, 130)) for _ in range(samples)]
+
+    for num_rounds in (0, 1, 8, 63, 64, _MAX_ROUNDS):
+        expected = [harmonia_reduced(message, num_rounds) for message in messages]
+        if harmonia_reduced_batch(messages, num_rounds) != expected:
+            return False
+
+    try:
+        harmonia_reduced_batch(messages[:1], _MAX_ROUNDS + 1)
+    except ValueError:
+        return True
+    return False
+
+
 def main():
     print("=" * 70)
     print("HARMONIA - REDUCED ROUNDS SECURITY ANALYSIS")
     print("=" * 70)
 
+    print(f"\nBatch matches reference: {'PASS' if test_batch_consistency() else 'FAIL'}")
+
     round_counts = [8, 16, 24, 32, 40, 48, 56, 64]
 
     print("\n### AVALANCHE EFFECT TEST ###\n")